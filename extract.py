@@ -18,14 +18,17 @@ Examples:
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
 import os
 import re
 import shutil
 import subprocess
 import time
+import traceback
+from dataclasses import dataclass
 from pathlib import Path
 
+from parsers.base_parser import EXMLParser, MissingTableError, XMLParseError, normalize_game_icon_path
 from parsers.base_parts import parse_base_parts
 from parsers.cooking import parse_cooking
 from parsers.fish import parse_fish
@@ -40,6 +43,7 @@ from utils.categorization import categorize_item, assert_unique_exact_group_owne
 from utils.clean import clean_data
 from utils.generate_controller_lookup import main as generate_controller_lookup_main
 from utils.images import extract_icons
+from utils.jsonio import dump_json, load_json
 from utils.localization import build_localization_json
 from utils.mbin import consolidate_mbin
 from utils.report import generate_refresh_report
@@ -49,6 +53,8 @@ REPO_ROOT = Path(__file__).resolve().parent
 DATA = REPO_ROOT / "data"
 EXTRACTED = DATA / "EXTRACTED"
 DEFAULT_PCBANKS = r"X:\Steam\steamapps\common\No Man's Sky\GAMEDATA\PCBANKS"
+PAK_MANIFEST = DATA / "mbin" / ".pak_manifest.json"
+MBIN_COMPILER = REPO_ROOT / "tools" / "MBINCompiler.exe"
 
 MBIN_FILTERS = [
     "*REALITY/TABLES/nms_reality_gcproducttable.mbin",
@@ -96,7 +102,16 @@ EXPECTED_MXML_AFTER_REFRESH = [
 
 
 def run(cmd: list[str], **kwargs) -> None:
-    subprocess.run(cmd, check=True, cwd=REPO_ROOT, **kwargs)
+    # Buffer output so chatty tools never block on console writes; both streams are
+    # shown only when the command fails (MBINCompiler reports failures on stdout).
+    kwargs.setdefault("stdout", subprocess.PIPE)
+    kwargs.setdefault("stderr", subprocess.PIPE)
+    result = subprocess.run(cmd, cwd=REPO_ROOT, text=True, errors="replace", **kwargs)
+    if result.returncode != 0:
+        for stream in (result.stdout, result.stderr):
+            if stream:
+                print(stream.rstrip())
+        raise subprocess.CalledProcessError(result.returncode, cmd, output=result.stdout, stderr=result.stderr)
 
 
 def parse_args() -> argparse.Namespace:
@@ -107,6 +122,11 @@ def parse_args() -> argparse.Namespace:
         help=f"Run full refresh prep using default PCBANKS path ({DEFAULT_PCBANKS}).",
     )
     parser.add_argument("--pcbanks", default="", help="Path to game PCBANKS. Enables full refresh prep.")
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Re-unpack and re-convert even when the .pak files are unchanged since the last refresh.",
+    )
     parser.add_argument("--report", action="store_true", help="Generate refresh report.")
     parser.add_argument("--no-strict", action="store_true", help="Skip strict smoke checks after extraction.")
     parser.add_argument("--images", action="store_true", help="Run only image extraction (skip JSON extraction).")
@@ -156,11 +176,106 @@ def extract_mbins_with_hgpaktool(pcbanks: str, output_dir: Path, filters: list[s
     return file_count
 
 
-def run_full_refresh_prep(pcbanks_arg: str) -> None:
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_file(path: Path) -> dict | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _stat_pak_files(pcbanks: str) -> dict[str, dict]:
+    stats = {}
+    for fname in sorted(os.listdir(pcbanks)):
+        if not fname.lower().endswith(".pak"):
+            continue
+        st = os.stat(os.path.join(pcbanks, fname))
+        stats[fname] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    return stats
+
+
+def _load_pak_manifest() -> dict:
+    try:
+        manifest = load_json(PAK_MANIFEST)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _unchanged_pak_hashes(pcbanks: str, current: dict[str, dict], stored: dict[str, dict]) -> dict[str, str] | None:
+    """
+    Compare PAK stats against the manifest from the last successful refresh.
+    Size + mtime matches are trusted; a size match with a different mtime falls back to sha256.
+
+    Returns:
+        None if any PAK changed, otherwise the known sha256 per PAK (entries without a stored hash are omitted)
+    """
+    if not current or set(current) != set(stored):
+        return None
+    hashes: dict[str, str] = {}
+    for fname, entry in current.items():
+        prev = stored.get(fname)
+        if not isinstance(prev, dict) or prev.get("size") != entry["size"]:
+            return None
+        prev_hash = prev.get("sha256")
+        if prev.get("mtime_ns") != entry["mtime_ns"]:
+            if not prev_hash or _hash_file(os.path.join(pcbanks, fname)) != prev_hash:
+                return None
+        if prev_hash:
+            hashes[fname] = prev_hash
+    return hashes
+
+
+def _conversion_settings_unchanged(stored: dict) -> bool:
+    """True when MBIN_FILTERS and MBINCompiler.exe match the last successful refresh."""
+    return stored.get("filters") == MBIN_FILTERS and stored.get("compiler") == _stat_file(MBIN_COMPILER)
+
+
+def _write_pak_manifest(pcbanks: str, current: dict[str, dict], known_hashes: dict[str, str]) -> None:
+    paks = {
+        fname: {**entry, "sha256": known_hashes.get(fname) or _hash_file(os.path.join(pcbanks, fname))}
+        for fname, entry in current.items()
+    }
+    manifest = {
+        "filters": MBIN_FILTERS,
+        "compiler": _stat_file(MBIN_COMPILER),
+        "paks": paks,
+    }
+    dump_json(manifest, PAK_MANIFEST, indent=2)
+
+
+def run_full_refresh_prep(pcbanks_arg: str, *, force: bool = False) -> None:
     pcbanks = resolve_game_path(pcbanks_arg)
     if not Path(pcbanks).exists():
         raise SystemExit(f"Game path does not exist: {pcbanks}")
 
+    mbin_dir = REPO_ROOT / "data" / "mbin"
+    pak_stats = _stat_pak_files(pcbanks)
+    if not force:
+        outputs_present = all((mbin_dir / name).exists() for name in EXPECTED_MXML_AFTER_REFRESH)
+        manifest = _load_pak_manifest()
+        known_hashes = (
+            _unchanged_pak_hashes(pcbanks, pak_stats, manifest.get("paks") or {})
+            if outputs_present and _conversion_settings_unchanged(manifest)
+            else None
+        )
+        if known_hashes is not None:
+            # Refresh stored mtimes so a hash-confirmed match takes the stat fast path next time.
+            _write_pak_manifest(pcbanks, pak_stats, known_hashes)
+            print(
+                "\n[INFO] .pak files, MBIN filters and MBINCompiler unchanged since last refresh; "
+                "skipping refresh prep (use --force-refresh to override)."
+            )
+            return
+
     print("\n--- Refresh Prep 1/3: Clean data ---")
     clean_data(REPO_ROOT)
 
@@ -172,8 +287,7 @@ def run_full_refresh_prep(pcbanks_arg: str) -> None:
     consolidate_mbin(REPO_ROOT)
 
     print("\n--- Refresh Prep 3/3: Convert MBIN -> MXML ---")
-    mbin_dir = REPO_ROOT / "data" / "mbin"
-    compiler = REPO_ROOT / "tools" / "MBINCompiler.exe"
+    compiler = MBIN_COMPILER
     if not compiler.exists():
         raise SystemExit(f"MBINCompiler not found: {compiler}")
 
@@ -187,6 +301,8 @@ def run_full_refresh_prep(pcbanks_arg: str) -> None:
             print(f"  - {name}")
         raise SystemExit(1)
 
+    _write_pak_manifest(pcbanks, pak_stats, {})
+
 
 def normalize_to_extracted(extracted_root: Path) -> None:
     src_dir = extracted_root / "TEXTURES" if (extracted_root / "TEXTURES").exists() else extracted_root / "textures"
@@ -236,10 +352,16 @@ def unpack_all_game_files_to_extracted(pcbanks_arg: str, extracted_root: Path) -
     print(f"  Unpacked {file_count} files from {pak_count} .pak files")
 
 
+@dataclass(slots=True)
+class SaveResult:
+    name: str
+    items: int
+    kb: float
+
+
 def save_json(data, filename: str) -> float:
     output_path = REPO_ROOT / "data" / "json" / filename
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent="\t", ensure_ascii=False)
+    dump_json(data, output_path, indent="\t")
     return output_path.stat().st_size / 1024
 
 
@@ -265,17 +387,18 @@ def apply_slugs(final_files: dict) -> None:
                 item['Slug'] = f"{prefix}{item_id}"
 
 
+def _is_missing_icon(item) -> bool:
+    return isinstance(item, dict) and 'IconPath' in item and not item['IconPath']
+
+
 def filter_missing_icons(data):
     if not isinstance(data, list):
         return data, 0
-    filtered = []
-    removed = 0
-    for item in data:
-        if isinstance(item, dict) and 'IconPath' in item and not item.get('IconPath'):
-            removed += 1
-            continue
-        filtered.append(item)
-    return filtered, removed
+    # Most tables have no empty icons; return the original list without copying in that case.
+    if not any(map(_is_missing_icon, data)):
+        return data, 0
+    filtered = [item for item in data if not _is_missing_icon(item)]
+    return filtered, len(data) - len(filtered)
 
 
 def dedupe_items_by_id(items: list, *, merge_missing_fields: bool = True) -> tuple[list, int]:
@@ -468,7 +591,7 @@ def normalize_upgrade_display_names(final_files: dict) -> int:
 def move_exocraft_upgrades(final_files: dict) -> int:
     exocraft = final_files.get('Exocraft.json')
     upgrades = final_files.get('Upgrades.json')
-    if not isinstance(exocraft, list) or not isinstance(upgrades, list):
+    if not isinstance(exocraft, list) or not exocraft or not isinstance(upgrades, list):
         return 0
     keep = []
     moved = 0
@@ -567,7 +690,6 @@ def enrich_corvette_metadata(final_files: dict, data_dir: Path) -> int:
     corvette_items = final_files.get('Corvette.json')
     if not isinstance(corvette_items, list) or not corvette_items:
         return 0
-    from parsers.base_parser import EXMLParser, normalize_game_icon_path
     parser = EXMLParser()
     source_tables = [data_dir / 'nms_basepartproducts.MXML', data_dir / 'nms_modularcustomisationproducts.MXML']
     metadata_by_id: dict[str, dict] = {}
@@ -581,11 +703,11 @@ def enrich_corvette_metadata(final_files: dict, data_dir: Path) -> int:
         table_prop = root.find('.//Property[@name="Table"]')
         if table_prop is None:
             continue
-        for product_elem in table_prop.findall('./Property[@name="Table"]'):
+        for product_elem in table_prop.iterfind('./Property[@name="Table"]'):
             item_id = parser.get_property_value(product_elem, 'ID', '')
             if not item_id:
                 continue
-            hero_icon_raw = parser.get_property_value(product_elem.find('.//Property[@name="HeroIcon"]'), 'Filename', '')
+            hero_icon_raw = parser.get_property_value(parser.find_child_property(product_elem, 'HeroIcon'), 'Filename', '')
             hero_icon = normalize_game_icon_path(hero_icon_raw) if hero_icon_raw else ''
             metadata_by_id[item_id] = {
                 'HeroIconPath': hero_icon or None,
@@ -630,7 +752,7 @@ def enrich_corvette_metadata(final_files: dict, data_dir: Path) -> int:
 def enrich_corvette_buildable_tech_labels(final_files: dict) -> int:
     corvette_items = final_files.get('Corvette.json')
     upgrades = final_files.get('Upgrades.json')
-    if not isinstance(corvette_items, list) or not isinstance(upgrades, list):
+    if not isinstance(corvette_items, list) or not corvette_items or not isinstance(upgrades, list) or not upgrades:
         return 0
     upgrades_by_id = {}
     for item in upgrades:
@@ -660,7 +782,6 @@ def enrich_exocraft_metadata(final_files: dict, data_dir: Path) -> int:
     exocraft_items = final_files.get('Exocraft.json')
     if not isinstance(exocraft_items, list) or not exocraft_items:
         return 0
-    from parsers.base_parser import EXMLParser, normalize_game_icon_path
     parser = EXMLParser()
     source_tables = [data_dir / 'nms_reality_gcproducttable.MXML', data_dir / 'nms_basepartproducts.MXML']
     metadata_by_id: dict[str, dict] = {}
@@ -674,13 +795,13 @@ def enrich_exocraft_metadata(final_files: dict, data_dir: Path) -> int:
         table_prop = root.find('.//Property[@name="Table"]')
         if table_prop is None:
             continue
-        for product_elem in table_prop.findall('./Property[@name="Table"]'):
+        for product_elem in table_prop.iterfind('./Property[@name="Table"]'):
             item_id = parser.get_property_value(product_elem, 'ID', '')
             if not item_id:
                 continue
-            hero_icon_raw = parser.get_property_value(product_elem.find('.//Property[@name="HeroIcon"]'), 'Filename', '')
+            hero_icon_raw = parser.get_property_value(parser.find_child_property(product_elem, 'HeroIcon'), 'Filename', '')
             hero_icon = normalize_game_icon_path(hero_icon_raw) if hero_icon_raw else ''
-            cost_prop = product_elem.find('.//Property[@name="Cost"]')
+            cost_prop = parser.find_child_property(product_elem, 'Cost')
             price_modifiers = None
             if cost_prop is not None:
                 price_modifiers = {
@@ -736,41 +857,39 @@ def enrich_buildings_metadata(final_files: dict, data_dir: Path) -> int:
     buildings_items = final_files.get('Buildings.json')
     if not isinstance(buildings_items, list) or not buildings_items:
         return 0
-    from parsers.base_parser import EXMLParser
-
     source_table = data_dir / 'basebuildingobjectstable.MXML'
     if not source_table.exists():
         return 0
 
     parser = EXMLParser()
-    try:
-        root = parser.load_xml(str(source_table))
-    except Exception:
-        return 0
-
-    objects_prop = root.find('.//Property[@name="Objects"]')
-    if objects_prop is None:
-        return 0
-
     metadata_by_id: dict[str, dict] = {}
-    for building_elem in objects_prop.findall('./Property[@name="Objects"]'):
+    rows = parser.iter_table_rows(str(source_table), 'Objects')
+    while True:
+        # Only a missing, unreadable or malformed table skips enrichment; row logic errors propagate.
+        try:
+            building_elem = next(rows)
+        except StopIteration:
+            break
+        except (OSError, XMLParseError, MissingTableError):
+            return 0
+
         item_id = parser.get_property_value(building_elem, 'ID', '')
         if not item_id:
             continue
 
         groups_list = []
-        groups_prop = building_elem.find('.//Property[@name="Groups"]')
+        groups_prop = parser.find_child_property(building_elem, 'Groups')
         if groups_prop is not None:
-            for grp_elem in groups_prop.findall('./Property[@name="Groups"]'):
+            for grp_elem in parser.child_properties(groups_prop, 'Groups'):
                 group_name = parser.get_property_value(grp_elem, 'Group', '')
                 subgroup = parser.get_property_value(grp_elem, 'SubGroupName', '')
                 if group_name:
                     groups_list.append({'Group': group_name, 'SubGroupName': subgroup or None})
 
         link_grid_data = None
-        link_elem = building_elem.find('.//Property[@name="LinkGridData"]')
+        link_elem = parser.find_child_property(building_elem, 'LinkGridData')
         if link_elem is not None:
-            network_elem = link_elem.find('.//Property[@name="Network"]')
+            network_elem = parser.find_property(link_elem, 'Network')
             link_type = (
                 parser.get_nested_enum(network_elem, 'LinkNetworkType', 'LinkNetworkType', '')
                 if network_elem is not None else ''
@@ -830,7 +949,6 @@ def run_json_extraction(*, report: bool, no_strict: bool) -> int:
     except Exception as e:
         print(f"  [WARN] Controller lookup generation failed: {e}")
 
-    from parsers.base_parser import EXMLParser
     EXMLParser._localization = None
     EXMLParser._controller_lookup = None
     EXMLParser.clear_xml_cache()
@@ -863,7 +981,6 @@ def run_json_extraction(*, report: bool, no_strict: bool) -> int:
             print(f"  [OK] {len(data)} items extracted\n")
         except Exception as e:
             print(f"  [ERROR] Failed: {e}\n")
-            import traceback
             traceback.print_exc()
 
     print("\n" + "=" * 70)
@@ -912,14 +1029,17 @@ def run_json_extraction(*, report: bool, no_strict: bool) -> int:
     total_skipped = 0
     total_preseeded_dupe_skips = 0
     uncategorized_items = []
+    uncategorized_append = uncategorized_items.append
+    categorized_appends = {filename: items.append for filename, items in categorized.items()}
     for item in items_to_categorize:
         target_file = categorize_item(item)
         if target_file is None:
             total_skipped += 1
-            uncategorized_items.append(item)
+            uncategorized_append(item)
             continue
-        if target_file in categorized:
-            categorized[target_file].append(item)
+        categorized_append = categorized_appends.get(target_file)
+        if categorized_append is not None:
+            categorized_append(item)
             total_categorized += 1
             continue
         if target_file in final_files and isinstance(final_files[target_file], list):
@@ -941,7 +1061,7 @@ def run_json_extraction(*, report: bool, no_strict: bool) -> int:
             total_categorized += 1
             continue
         total_skipped += 1
-        uncategorized_items.append(item)
+        uncategorized_append(item)
 
     print(f"Categorized {total_categorized} items")
     print(f"Skipped {total_skipped} items (saved to none.json for review)\n")
@@ -952,8 +1072,7 @@ def run_json_extraction(*, report: bool, no_strict: bool) -> int:
     if removed_uncategorized:
         print(f"  [FILTER] Removed {removed_uncategorized} items with empty IconPath from none.json")
     uncategorized_file = REPO_ROOT / 'data' / 'json' / 'none.json'
-    with open(uncategorized_file, 'w', encoding='utf-8') as f:
-        json.dump(uncategorized_items, f, indent=2, ensure_ascii=False)
+    dump_json(uncategorized_items, uncategorized_file, indent=2)
     print(f"  [REVIEW] Saved {len(uncategorized_items)} uncategorized items to none.json\n")
 
     final_files.update(categorized)
@@ -1042,23 +1161,25 @@ def run_json_extraction(*, report: bool, no_strict: bool) -> int:
 
     print("STEP 3: Saving final files...")
     print("-" * 70 + "\n")
-    results = []
+    results: list[SaveResult] = []
+    total_items = 0
+    total_size = 0.0
     for filename, data in sorted(final_files.items()):
-        file_size = save_json(data if data is not None else [], filename)
-        item_count = len(data) if isinstance(data, list) else 0
-        results.append((filename, item_count, file_size))
-        print(f"  {filename:30} {item_count:4} items  {file_size:8.1f} KB")
+        result = SaveResult(
+            filename,
+            len(data) if isinstance(data, list) else 0,
+            save_json(data if data is not None else [], filename),
+        )
+        results.append(result)
+        total_items += result.items
+        total_size += result.kb
+        print(f"  {filename:30} {result.items:4} items  {result.kb:8.1f} KB")
 
     elapsed = time.time() - start_time
     print("\n" + "=" * 70)
     print("EXTRACTION COMPLETE!")
     print("=" * 70)
     print(f"\nGenerated {len(results)} files in {elapsed:.1f} seconds:\n")
-    total_items = 0
-    total_size = 0
-    for filename, item_count, file_size in results:
-        total_items += item_count
-        total_size += file_size
     print(f"  TOTAL: {total_items} items  {total_size:.1f} KB")
     print("\n" + "=" * 70)
     print(f"Output location: {REPO_ROOT / 'data' / 'json'}")
@@ -1144,7 +1265,7 @@ def main() -> int:
 
     refresh_requested = args.refresh or bool(args.pcbanks)
     if refresh_requested:
-        run_full_refresh_prep(pcbanks_arg_effective)
+        run_full_refresh_prep(pcbanks_arg_effective, force=args.force_refresh)
 
     extract_exit = run_json_extraction(report=args.report, no_strict=args.no_strict)
     if extract_exit != 0:
@@ -1,11 +1,29 @@
 """Base XML Parser for EXML/MXML files"""
 import re
-import xml.etree.ElementTree as ET
-from typing import Any, Optional, Callable
+import string
+import sys
+from functools import lru_cache, partial
+from typing import Any, Optional, Callable, Iterator
 import json
 import os
 from pathlib import Path
 
+from utils.jsonio import load_json
+
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:  # lxml is optional; stdlib ElementTree parses the same trees, just slower.
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+# Malformed-MXML error for either backend (lxml's XMLSyntaxError subclasses ParseError).
+XMLParseError = ET.ParseError
+
+
+class MissingTableError(LookupError):
+    """Raised by EXMLParser.iter_table_rows when the file has no top-level container property."""
+
 # Words that stay lowercase in title case (conjunctions, articles, short prepositions)
 _LOWERCASE_WORDS = frozenset({
     'a', 'an', 'the', 'and', 'or', 'but', 'of', 'in', 'on', 'at', 'to', 'for',
@@ -19,6 +37,21 @@ _MISSING_LOCALIZATION_OVERRIDES = {
 
 _MARKUP_TAG_RE = re.compile(r'<[^>]*>')
 _FE_TOKEN_RE = re.compile(r'\bFE_[A-Z0-9_]+\b')
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+_LOCALIZATION_KEY_CHARS_TABLE = str.maketrans('', '', string.ascii_uppercase + string.digits + '_')
+_PLAIN_INT_RE = re.compile(r'[-+]?[0-9]{1,15}')
+_PLAIN_DECIMAL_RE = re.compile(r'[-+]?[0-9]+\.[0-9]+')
+
+# Upper bound on cached parsed roots; a full extraction touches about a dozen tables.
+_XML_CACHE_MAX_ENTRIES = 16
+# Files at least this big get a read-ahead hint before parsing (see _advise_sequential_read).
+_READAHEAD_MIN_BYTES = 4 * 1024 * 1024
+
+# One shared lxml parser for every MXML table, so all cached trees share libxml2's interned
+# element/attribute names (Property, name, value, ...); MXML never uses xml:id, so skip the ID hash.
+_MXML_PARSER = (
+    ET.XMLParser(huge_tree=True, remove_blank_text=True, collect_ids=False) if HAS_LXML else None
+)
 
 
 def strip_markup_tags(text: str) -> str:
@@ -27,11 +60,66 @@ def strip_markup_tags(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return text
+    return _strip_markup_tags_str(text)
+
+
+def _strip_markup_tags_str(text: str) -> str:
+    """strip_markup_tags for callers that already hold a str."""
     if '<' not in text:
         return text
     return _MARKUP_TAG_RE.sub('', text)
 
 
+def _icon_to_readable(icon_path: str) -> str:
+    if not icon_path:
+        return ""
+    upper = icon_path.upper()
+    if upper.startswith("KEYBOARD/"):
+        filename = Path(icon_path).name
+        stem = Path(filename).stem  # e.g. INTERACT.E or KEYWIDE.TAB
+        key = stem.split(".")[-1]
+        return key.upper()
+    if upper.startswith("MOUSE/KEY.MOUSELEFT"):
+        return "LMB"
+    if upper.startswith("MOUSE/KEY.MOUSERIGHT"):
+        return "RMB"
+    return ""
+
+
+def _label_control_token(token_map: dict[str, str], match: re.Match[str]) -> str:
+    token = match.group(0)
+    readable = _icon_to_readable(token_map.get(token, ""))
+    if readable:
+        return f"[{readable}]"
+    return token
+
+
+# (NMS_FE_TOKEN_MODE, NMS_INPUT_PLATFORM, controller lookup, labeler); rebuilt when any of them changes.
+_FE_STATE: Optional[tuple] = None
+
+
+def _control_token_labeler() -> Optional[Callable[[re.Match[str]], str]]:
+    """Return the FE_* match -> label callback for the active platform, or None when token mode is raw."""
+    global _FE_STATE
+    mode_env = os.environ.get("NMS_FE_TOKEN_MODE")
+    platform_env = os.environ.get("NMS_INPUT_PLATFORM")
+    mode = (mode_env or "resolved").strip().lower()
+    lookup = None if mode in {"raw", "off", "disabled"} else EXMLParser.load_controller_lookup()
+
+    state = _FE_STATE
+    if state is not None and state[0] == mode_env and state[1] == platform_env and state[2] is lookup:
+        return state[3]
+
+    labeler = None
+    if lookup is not None:
+        token_map = lookup.get((platform_env or "Win").strip(), {})
+        labeler = partial(_label_control_token, token_map)
+    _FE_STATE = (mode_env, platform_env, lookup, labeler)
+    # Memoised translations with FE_* tokens embed labels for the previous state.
+    EXMLParser._translate_fe_cache.clear()
+    return labeler
+
+
 def normalize_control_tokens(text: str) -> str:
     """
     Convert control placeholders like FE_ALT1 into readable labels.
@@ -39,74 +127,65 @@ def normalize_control_tokens(text: str) -> str:
     """
     if not text or not isinstance(text, str):
         return text
-
-    mode = (os.environ.get("NMS_FE_TOKEN_MODE") or "resolved").strip().lower()
-    if mode in {"raw", "off", "disabled"}:
-        return text
     if "FE_" not in text:
         return text
+    token_label = _control_token_labeler()
+    if token_label is None:
+        return text
+    return _FE_TOKEN_RE.sub(token_label, text)
 
-    lookup = EXMLParser.load_controller_lookup()
-    platform = (os.environ.get("NMS_INPUT_PLATFORM") or "Win").strip()
-    token_map = lookup.get(platform, {})
-
-    def _icon_to_readable(icon_path: str) -> str:
-        if not icon_path:
-            return ""
-        upper = icon_path.upper()
-        if upper.startswith("KEYBOARD/"):
-            filename = Path(icon_path).name
-            stem = Path(filename).stem  # e.g. INTERACT.E or KEYWIDE.TAB
-            key = stem.split(".")[-1]
-            return key.upper()
-        if upper.startswith("MOUSE/KEY.MOUSELEFT"):
-            return "LMB"
-        if upper.startswith("MOUSE/KEY.MOUSERIGHT"):
-            return "RMB"
-        return ""
-
-    def _token_label(match: re.Match[str]) -> str:
-        token = match.group(0)
-        icon_path = token_map.get(token, "")
-        readable = _icon_to_readable(icon_path)
-        if readable:
-            return f"[{readable}]"
-        return token
 
-    return _FE_TOKEN_RE.sub(_token_label, text)
+def _clean_display_text_str(text: str) -> str:
+    """
+    Strip markup tags, then resolve FE_* control tokens.
+    Equivalent to normalize_control_tokens(strip_markup_tags(text)) for game strings.
+    """
+    # Strip first: tags removed next to a token change its \b boundaries.
+    text = _strip_markup_tags_str(text)
+    if "FE_" not in text:
+        return text
+    token_label = _control_token_labeler()
+    if token_label is None:
+        return text
+    return _FE_TOKEN_RE.sub(token_label, text)
 
 
 def _capitalize_word(word: str, force_capitalize: bool) -> str:
     """Capitalize a single word, including words in single quotes like 'apple' -> 'Apple'."""
-    if len(word) >= 3 and word.startswith("'") and word.endswith("'"):
-        inner = word[1:-1]
-        return "'" + (inner.capitalize() if force_capitalize else inner.lower()) + "'"
-    return word.capitalize() if force_capitalize else word.lower()
+    if not force_capitalize:
+        return word.lower()
+    # str.capitalize() is a single C call and beats slicing head/tail for ASCII words.
+    if word[:1] == "'" and len(word) >= 3 and word[-1] == "'":
+        return "'" + word[1:-1].capitalize() + "'"
+    return word.capitalize()
 
 
+@lru_cache(maxsize=8192)
 def title_case_name(s: str) -> str:
     """
     Title-case a name with conjunctions/articles kept lowercase.
     e.g. "CAKE OF GLASS" -> "Cake of Glass", not "Cake Of Glass".
     Words in single quotes get the first letter inside the quotes capitalized: 'apple' -> 'Apple'.
     """
-    if not s or not s.strip():
+    if not s:
         return s
-    words = s.strip().split()
+    words = s.split()
     if not words:
         return s
+    last = len(words) - 1
     result = []
     for i, word in enumerate(words):
         lower = word.lower()
-        is_first = i == 0
-        is_last = i == len(words) - 1
-        if is_first or is_last or lower not in _LOWERCASE_WORDS:
-            result.append(_capitalize_word(word, force_capitalize=True))
+        force_capitalize = i == 0 or i == last or lower not in _LOWERCASE_WORDS
+        if len(word) >= 3 and word[0] == "'" and word[-1] == "'":
+            result.append(_capitalize_word(word, force_capitalize))
         else:
-            result.append(_capitalize_word(word, force_capitalize=False))
+            # Reuse the lowered word instead of lowering again for small words.
+            result.append(word.capitalize() if force_capitalize else lower)
     return ' '.join(result)
 
 
+@lru_cache(maxsize=8192)
 def normalize_game_icon_path(game_path: str) -> str:
     """
     Normalize a game texture path to match data/EXTRACTED layout.
@@ -119,7 +198,8 @@ def normalize_game_icon_path(game_path: str) -> str:
         return ''
     # Lowercase, forward slashes (game uses backslashes or forward)
     normalized = game_path.strip().replace('\\', '/').lower()
-    return normalized
+    # Differently-cased source paths normalize to the same string; intern so rows share one copy.
+    return sys.intern(normalized)
 
 
 def looks_like_localization_key(value: str) -> bool:
@@ -130,7 +210,8 @@ def looks_like_localization_key(value: str) -> bool:
         return False
     if '_' not in value:
         return False
-    return bool(re.fullmatch(r'[A-Z0-9_]+', value))
+    # Deleting every allowed character leaves an empty string iff value matches [A-Z0-9_]+.
+    return not value.translate(_LOCALIZATION_KEY_CHARS_TABLE)
 
 
 def unresolved_localization_key_count(localization: dict, *keys: str) -> int:
@@ -161,29 +242,121 @@ def format_stat_type_name(stat_type: str, strip_prefixes: tuple[str, ...] = ())
     for token in cleaned.split('_'):
         if not token:
             continue
-        # Split CamelCase chunks so BurstCap -> Burst Cap.
-        token = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', ' ', token)
-        token = re.sub(r'(?<=[A-Z])(?=[A-Z][a-z])', ' ', token)
-        words.append(token)
+        # Split CamelCase chunks so BurstCap -> Burst Cap (and HUDText -> HUD Text).
+        words.append(_CAMEL_CASE_BOUNDARY_RE.sub(' ', token))
 
     return ' '.join(words).title()
 
 
+# Per-element Property indexes: element -> [direct children by name, descendants by name or None].
+# Parsers read many properties from the same row back to back, so one child walk serves all of
+# them. Bounded and keyed by the element itself; the strong reference keeps the lxml proxy (and
+# therefore its identity) alive while it is cached.
+_PROPERTY_INDEX_CACHE: dict[Any, list] = {}
+_PROPERTY_INDEX_CACHE_SIZE = 64
+
+
+def _property_index(element: ET.Element) -> list:
+    entry = _PROPERTY_INDEX_CACHE.get(element)
+    if entry is None:
+        direct: dict[str, ET.Element] = {}
+        for child in element:
+            if child.tag == 'Property':
+                direct.setdefault(child.get('name'), child)
+        entry = [direct, None]
+        _PROPERTY_INDEX_CACHE[element] = entry
+        if len(_PROPERTY_INDEX_CACHE) > _PROPERTY_INDEX_CACHE_SIZE:
+            del _PROPERTY_INDEX_CACHE[next(iter(_PROPERTY_INDEX_CACHE))]
+    return entry
+
+
+def _deep_property_index(element: ET.Element) -> dict[str, ET.Element]:
+    """First Property descendant per name, in document order (matches find('.//Property[@name=...]'))."""
+    entry = _property_index(element)
+    deep = entry[1]
+    if deep is None:
+        deep = {}
+        for prop in element.iter('Property'):
+            if prop is not element:
+                deep.setdefault(prop.get('name'), prop)
+        entry[1] = deep
+    return deep
+
+
+def _advise_sequential_read(filepath: str) -> None:
+    """Ask the OS to start read-ahead on a large MXML file before the parser reads it."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(filepath, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if os.fstat(fd).st_size >= _READAHEAD_MIN_BYTES:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def parse_mxml(filepath: str) -> ET.Element:
+    """Parse an EXML/MXML file and return its root element (uncached)."""
+    _advise_sequential_read(filepath)
+    return ET.parse(filepath, parser=_MXML_PARSER).getroot()
+
+
+def _iter_table_rows_stdlib(filepath: str, container_name: str) -> Iterator[ET.Element]:
+    """ElementTree version of EXMLParser.iter_table_rows (no getparent, so track depth)."""
+    depth = 0
+    container = None
+    found = False
+    for event, elem in ET.iterparse(filepath, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 2 and elem.tag == 'Property' and elem.get('name') == container_name:
+                container = elem
+                found = True
+            continue
+        depth -= 1
+        if (
+            depth == 2
+            and container is not None
+            and elem.tag == 'Property'
+            and elem.get('name') == container_name
+        ):
+            yield elem
+            elem.clear()
+            container.remove(elem)
+        elif depth == 1 and elem is container:
+            container = None
+    if not found:
+        raise MissingTableError(container_name)
+
+
 class EXMLParser:
     """Base class for EXML/MXML parsing with common utilities"""
 
     _localization = None  # Cache for localization data
     _controller_lookup = None  # Cache for FE token -> icon lookups
     _xml_cache: dict[str, tuple[float, ET.Element]] = {}
+    # Finished translations: keyed by the loc key alone when it exists in localization (the
+    # default is never used then), otherwise by (key, default).
+    _translate_cache: dict[Any, str] = {}
+    # Same keys, for translations whose source text has FE_* tokens; these also depend on
+    # NMS_FE_TOKEN_MODE / NMS_INPUT_PLATFORM, so they are revalidated on every hit.
+    _translate_fe_cache: dict[Any, str] = {}
 
     @classmethod
     def load_localization(cls) -> dict:
         """Load and cache the English localization dictionary"""
         if cls._localization is None:
+            cls._translate_cache.clear()
+            cls._translate_fe_cache.clear()
             loc_path = Path(__file__).parent.parent / 'data' / 'json' / 'localization.json'
             if loc_path.exists():
-                with open(loc_path, 'r', encoding='utf-8') as f:
-                    cls._localization = json.load(f)
+                cls._localization = load_json(loc_path)
                 print(f"[OK] Loaded {len(cls._localization)} translations")
             else:
                 cls._localization = {}
@@ -194,13 +367,14 @@ class EXMLParser:
     def load_controller_lookup(cls) -> dict[str, dict[str, str]]:
         """Load token->icon mappings by platform from generated lookup JSON."""
         if cls._controller_lookup is None:
+            cls._translate_cache.clear()
+            cls._translate_fe_cache.clear()
             lookup_path = Path(__file__).parent.parent / "data" / "json" / "controllerLookup.generated.json"
             if not lookup_path.exists():
                 cls._controller_lookup = {}
                 return cls._controller_lookup
             try:
-                with open(lookup_path, "r", encoding="utf-8") as f:
-                    raw = json.load(f)
+                raw = load_json(lookup_path)
                 parsed: dict[str, dict[str, str]] = {}
                 for platform, rows in (raw or {}).items():
                     if not isinstance(platform, str) or not isinstance(rows, list):
@@ -226,7 +400,9 @@ class EXMLParser:
         items (categorized and none.json). If the key is missing from
         localization.json we fall back to default, or to a title-cased key
         (e.g. UI_STARCHART_BUILDER_NAME -> "Ui Starchart Builder") so names
-        are never blank.
+        are never blank. Results are cached (per key for known keys, per
+        (key, default) otherwise) until the localization, the controller lookup
+        or the FE token settings (NMS_FE_TOKEN_MODE / NMS_INPUT_PLATFORM) change.
 
         Args:
             key: Localization key (e.g., "TECH_FRAGMENT_NAME")
@@ -236,6 +412,16 @@ class EXMLParser:
             English translation or default/key if not found
         """
         loc = cls.load_localization()
+        cache_key = key if key in loc else (key, default)
+        cached = cls._translate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if cache_key in cls._translate_fe_cache:
+            # Refresh the FE token state; a changed mode/platform clears _translate_fe_cache.
+            _control_token_labeler()
+            cached = cls._translate_fe_cache.get(cache_key)
+            if cached is not None:
+                return cached
         if default is None:
             default = key
         translation = loc.get(key, _MISSING_LOCALIZATION_OVERRIDES.get(key, default))
@@ -253,11 +439,16 @@ class EXMLParser:
         if key.endswith('_NAME') and isinstance(translation, str):
             translation = title_case_name(translation)
 
-        # Remove game markup tags (<TECHNOLOGY>, <>, etc.) so output is plain text
-        translation = strip_markup_tags(translation)
-        # Convert control placeholders to readable labels.
-        translation = normalize_control_tokens(translation)
+        # Remove game markup tags (<TECHNOLOGY>, <>, etc.) and convert control
+        # placeholders to readable labels so output is plain text.
+        cache = cls._translate_cache
+        if isinstance(translation, str):
+            translation = _strip_markup_tags_str(translation)
+            if 'FE_' in translation:
+                cache = cls._translate_fe_cache
+            translation = _clean_display_text_str(translation)
 
+        cache[cache_key] = translation
         return translation
 
     @staticmethod
@@ -275,12 +466,88 @@ class EXMLParser:
         """
         if element is None:
             return default
-        # Fast path: direct child lookup first, then deep search fallback.
-        prop = element.find(f'./Property[@name="{name}"]')
+        # Direct children first, then the first descendant in document order (same as .// find).
+        direct, deep = _property_index(element)
+        prop = direct.get(name)
         if prop is None:
-            prop = element.find(f'.//Property[@name="{name}"]')
+            prop = deep.get(name) if deep is not None else _deep_property_index(element).get(name)
         return prop.get('value', default) if prop is not None else default
 
+    @staticmethod
+    def get_property_values(element: ET.Element, names: tuple[str, ...], default: str = '') -> list[str]:
+        """
+        Read several properties from the same element with one index fetch.
+        Each value matches what get_property_value(element, name, default) would return,
+        including the deep-search fallback for names that are not direct children.
+
+        Args:
+            element: Parent XML element
+            names: Property names to read
+            default: Default value for any name not found
+
+        Returns:
+            Values in the same order as names
+        """
+        if element is None:
+            return [default] * len(names)
+        direct, deep = _property_index(element)
+        values = []
+        for name in names:
+            prop = direct.get(name)
+            if prop is None:
+                if deep is None:
+                    deep = _deep_property_index(element)
+                prop = deep.get(name)
+            values.append(prop.get('value', default) if prop is not None else default)
+        return values
+
+    @staticmethod
+    def find_property(element: ET.Element, name: str) -> Optional[ET.Element]:
+        """
+        First Property descendant with the given name, in document order.
+        Same result as element.find('.//Property[@name="..."]').
+
+        Args:
+            element: Parent XML element
+            name: Property name to find
+
+        Returns:
+            Matching Property element, or None
+        """
+        if element is None:
+            return None
+        return element.find(f'.//Property[@name="{name}"]')
+
+    @staticmethod
+    def find_child_property(element: ET.Element, name: str) -> Optional[ET.Element]:
+        """
+        Direct Property child with the given name (first occurrence), without a subtree walk.
+        Shares the per-element child index with get_property_value, so reading values and
+        sub-elements from the same row costs one pass over its children.
+
+        Args:
+            element: Parent XML element
+            name: Property name to find
+
+        Returns:
+            Matching Property element, or None
+        """
+        if element is None:
+            return None
+        return _property_index(element)[0].get(name)
+
+    @staticmethod
+    def child_properties(element: ET.Element, name: str = None) -> list[ET.Element]:
+        """
+        Direct Property children of an element, optionally only those with the given name.
+        Same result as findall('./Property') / findall('./Property[@name="..."]').
+        """
+        if element is None:
+            return []
+        if name is None:
+            return [child for child in element if child.tag == 'Property']
+        return [child for child in element if child.tag == 'Property' and child.get('name') == name]
+
     @staticmethod
     def get_nested_enum(element: ET.Element, outer_name: str, inner_name: str = None, default: str = '') -> str:
         """
@@ -288,11 +555,15 @@ class EXMLParser:
         Returns the inner value (e.g. "Common"). If inner_name is None, uses outer_name for both.
         """
         name = inner_name if inner_name is not None else outer_name
-        outer = element.find(f'.//Property[@name="{outer_name}"]')
+        # First match in document order (like .// find), read from the row's cached deep index.
+        outer = _deep_property_index(element).get(outer_name)
         if outer is None:
             return default
-        inner = outer.find(f'Property[@name="{name}"]')
-        return inner.get('value', default) if inner is not None else default
+        # Enum wrappers hold one or two children; scan them rather than indexing (and caching) each wrapper.
+        for inner in outer:
+            if inner.tag == 'Property' and inner.get('name') == name:
+                return inner.get('value', default)
+        return default
 
     @staticmethod
     def parse_value(value_str: str) -> Any:
@@ -314,14 +585,26 @@ class EXMLParser:
         if not value_str:
             return ''
 
-        # Check for boolean
-        if value_str.lower() in ('true', 'false'):
-            return value_str.lower() == 'true'
+        # Exact-case booleans are the norm in MXML; skip the lower() allocation for them.
+        if value_str == 'true':
+            return True
+        if value_str == 'false':
+            return False
 
         # Fast skip for obvious non-numeric values to avoid exception-heavy parsing.
         if value_str[0] not in ('-', '+') and not value_str[0].isdigit():
+            lowered = value_str.lower()
+            if lowered in ('true', 'false'):
+                return lowered == 'true'
             return value_str
 
+        # Plain integers/decimals (the vast majority) convert directly. Integers are capped
+        # at 15 digits so int() matches the float round-trip used for longer values below.
+        if _PLAIN_INT_RE.fullmatch(value_str):
+            return int(value_str)
+        if _PLAIN_DECIMAL_RE.fullmatch(value_str):
+            return float(value_str)
+
         # Try numeric parsing
         try:
             # Try float first (works for both int and float)
@@ -348,10 +631,10 @@ class EXMLParser:
         if colour_element is None:
             return 'FFFFFF'
 
-        parser = EXMLParser()
-        r = int(float(parser.get_property_value(colour_element, 'R', '1')) * 255)
-        g = int(float(parser.get_property_value(colour_element, 'G', '1')) * 255)
-        b = int(float(parser.get_property_value(colour_element, 'B', '1')) * 255)
+        r, g, b = (
+            int(float(value) * 255)
+            for value in EXMLParser.get_property_values(colour_element, ('R', 'G', 'B'), '1')
+        )
 
         return f"{r:02X}{g:02X}{b:02X}"
 
@@ -372,7 +655,9 @@ class EXMLParser:
         array_element = parent_element.find(f'.//Property[@name="{property_name}"]')
 
         if array_element is not None:
-            for item_element in array_element.findall('./Property'):
+            for item_element in array_element:
+                if item_element.tag != 'Property':
+                    continue
                 parsed_item = item_parser(item_element)
                 if parsed_item is not None:
                     items.append(parsed_item)
@@ -395,7 +680,8 @@ class EXMLParser:
     @staticmethod
     def load_xml(filepath: str) -> ET.Element:
         """
-        Load and parse an XML/MXML file.
+        Load and parse an XML/MXML file. Parsed roots are cached per path (invalidated
+        on mtime change) and the cache keeps at most _XML_CACHE_MAX_ENTRIES roots.
 
         Args:
             filepath: Path to EXML/MXML file
@@ -407,18 +693,71 @@ class EXMLParser:
         key = str(path.resolve())
         mtime = path.stat().st_mtime
 
-        cached = EXMLParser._xml_cache.get(key)
+        cache = EXMLParser._xml_cache
+        cached = cache.pop(key, None)
         if cached is not None:
             cached_mtime, cached_root = cached
             if cached_mtime == mtime:
+                cache[key] = cached  # re-insert as most recently used
                 return cached_root
 
-        tree = ET.parse(filepath)
-        root = tree.getroot()
-        EXMLParser._xml_cache[key] = (mtime, root)
+        root = parse_mxml(filepath)
+        cache[key] = (mtime, root)
+        # Dicts keep insertion order, so the first key is the least recently used root.
+        while len(cache) > _XML_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
         return root
 
+    @staticmethod
+    def iter_table_rows(filepath: str, container_name: str = 'Table') -> Iterator[ET.Element]:
+        """
+        Stream the rows of a top-level array property without building the full tree.
+        Each row is complete when yielded and is cleared once the caller moves on, so
+        memory stays flat. Use this for tables read by a single consumer; tables shared
+        across parsers should go through load_xml so the parsed root is reused.
+
+        Args:
+            filepath: Path to EXML/MXML file
+            container_name: Name of the top-level array property (rows share the same name)
+
+        Yields:
+            Row elements, in document order
+
+        Raises:
+            MissingTableError: After parsing, if there is no top-level container_name property
+                (an empty container yields nothing and does not raise)
+        """
+        _advise_sequential_read(filepath)
+        if not HAS_LXML:
+            yield from _iter_table_rows_stdlib(filepath, container_name)
+            return
+        context = ET.iterparse(
+            filepath, events=('end',), tag='Property', huge_tree=True, remove_blank_text=True
+        )
+        found = False
+        for _, elem in context:
+            parent = elem.getparent()
+            if parent is not None and parent.getparent() is None and elem.get('name') == container_name:
+                found = True  # the container itself, ended after its rows
+                continue
+            if (
+                parent is None
+                or elem.get('name') != container_name
+                or parent.get('name') != container_name
+                or parent.getparent() is None
+                or parent.getparent().getparent() is not None
+            ):
+                continue
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+        del context
+        if not found:
+            raise MissingTableError(container_name)
+
     @classmethod
     def clear_xml_cache(cls) -> None:
         """Clear cached XML roots (useful before a fresh extraction run)."""
         cls._xml_cache.clear()
+        _PROPERTY_INDEX_CACHE.clear()
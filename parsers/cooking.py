@@ -1,49 +1,69 @@
 """Parse Cooking from MXML to JSON"""
+import re
+from functools import lru_cache
+
 from .base_parser import (
     EXMLParser,
+    MissingTableError,
 )
 from .product_lookup import load_product_lookup
 from pathlib import Path
 from typing import Any
 
-
+# Leaf paths worth keeping as reward stats (matched against the lowercased path).
+_REWARD_STAT_MARKER_RE = re.compile(r'amount|value|chance|duration|time|bonus|mult|min|max')
+_EFFECT_CATEGORY_BY_PREFIX = {
+    'JETPACK': 'Jetpack',
+    'HAZ': 'Hazard Protection',
+    'ENERGY': 'Life Support',
+    'HEALTH': 'Health',
+    'STAMINA': 'Stamina',
+}
+_EFFECT_CATEGORY_PREFIX_RE = re.compile(r'DE_FOOD_(JETPACK|HAZ|ENERGY|HEALTH|STAMINA)')
+# Internal reward stat keys -> readable labels.
+_READABLE_REWARD_STAT_KEYS = {
+    'GcRewardEnergy.Amount': 'LifeSupportRechargeAmount',
+    'GcRewardRefreshHazProt.Amount': 'HazardProtectionRechargeAmount',
+    'GcRewardStamina.Amount': 'StaminaRechargeAmount',
+    'GcRewardHealth.Amount': 'HealthRechargeAmount',
+}
+_REWARD_EFFECT_LOOKUP_CACHE: dict[tuple[str, float], dict[str, dict[str, Any]]] = {}
+
+
+@lru_cache(maxsize=1024)
 def _map_effect_category(reward_id: str) -> str:
     """Map raw RewardID to a friendly effect category."""
     if not isinstance(reward_id, str) or not reward_id:
         return 'Unknown'
-    rid = reward_id.upper()
-    if rid.startswith('DE_FOOD_JETPACK'):
-        return 'Jetpack'
-    if rid.startswith('DE_FOOD_HAZ'):
-        return 'Hazard Protection'
-    if rid.startswith('DE_FOOD_ENERGY'):
-        return 'Life Support'
-    if rid.startswith('DE_FOOD_HEALTH'):
-        return 'Health'
-    if rid.startswith('DE_FOOD_STAMINA'):
-        return 'Stamina'
-    return 'Unknown'
+    match = _EFFECT_CATEGORY_PREFIX_RE.match(reward_id.upper())
+    return _EFFECT_CATEGORY_BY_PREFIX[match.group(1)] if match else 'Unknown'
 
 
-def _flatten_property_leaves(prop_elem, prefix='') -> list[tuple[str, str]]:
+def _flatten_property_leaves(prop_elem, prefix='', *, marked_only: bool = False) -> list[tuple[str, str]]:
     """
     Flatten nested <Property> trees into (path, value) leaves.
     Leaf = Property with a value and no nested Property children.
+    With marked_only, only leaves whose path contains a reward stat marker are kept;
+    markers never span a '.', so the match is tracked per path segment on the way down.
     """
     if prop_elem is None:
         return []
-    name = prop_elem.attrib.get('name', '').strip()
-    value = prop_elem.attrib.get('value', '')
-    current = f"{prefix}.{name}" if prefix and name else (name or prefix)
-    children = prop_elem.findall('./Property')
-    if children:
-        out: list[tuple[str, str]] = []
-        for child in children:
-            out.extend(_flatten_property_leaves(child, current))
-        return out
-    if name:
-        return [(current, value)]
-    return []
+    out: list[tuple[str, str]] = []
+    marker_search = _REWARD_STAT_MARKER_RE.search
+    # Explicit stack instead of recursion; children are pushed reversed to keep document order.
+    stack = [(prop_elem, prefix, not marked_only or marker_search(prefix.lower()) is not None)]
+    while stack:
+        elem, parent_path, matched = stack.pop()
+        name = elem.get('name', '').strip()
+        current = f"{parent_path}.{name}" if parent_path and name else (name or parent_path)
+        if name and not matched:
+            matched = marker_search(name.lower()) is not None
+        children = [child for child in elem if child.tag == 'Property']
+        if children:
+            stack.extend((child, current, matched) for child in reversed(children))
+        elif name and matched:
+            out.append((current, elem.get('value', '')))
+    return out
 
 
 def _extract_reward_effect_stats(parser: EXMLParser, reward_entry) -> dict[str, Any]:
@@ -51,26 +71,10 @@ def _extract_reward_effect_stats(parser: EXMLParser, reward_entry) -> dict[str,
     Extract scalar stat-like fields from a reward entry.
     Keeps numeric/bool leaves on amount/value/chance/duration/multiplier paths.
     """
-    leaves = _flatten_property_leaves(reward_entry)
+    leaves = _flatten_property_leaves(reward_entry, marked_only=True)
     stats = {}
     used_keys: set[str] = set()
-    key_markers = (
-        'amount',
-        'value',
-        'chance',
-        'duration',
-        'time',
-        'bonus',
-        'mult',
-        'min',
-        'max',
-    )
     for path, raw_value in leaves:
-        if not isinstance(path, str):
-            continue
-        path_l = path.lower()
-        if not any(marker in path_l for marker in key_markers):
-            continue
         parsed = parser.parse_value(raw_value)
         if isinstance(parsed, (int, float, bool)):
             # Prefer concise, readable keys over full nested XML paths.
@@ -88,28 +92,11 @@ def _extract_reward_effect_stats(parser: EXMLParser, reward_entry) -> dict[str,
                     candidate = f"{short_key}_{i}"
                 short_key = candidate
             used_keys.add(short_key)
-            stats[short_key] = parsed
+            # Rename the well-known stats to readable labels as they are stored.
+            stats[_READABLE_REWARD_STAT_KEYS.get(short_key, short_key)] = parsed
     return stats
 
 
-def _humanize_reward_effect_stats(stats: dict[str, Any] | None) -> dict[str, Any] | None:
-    """Map internal reward stat keys to readable labels."""
-    if not isinstance(stats, dict) or not stats:
-        return stats
-
-    key_map = {
-        'GcRewardEnergy.Amount': 'LifeSupportRechargeAmount',
-        'GcRewardRefreshHazProt.Amount': 'HazardProtectionRechargeAmount',
-        'GcRewardStamina.Amount': 'StaminaRechargeAmount',
-        'GcRewardHealth.Amount': 'HealthRechargeAmount',
-    }
-
-    out: dict[str, Any] = {}
-    for key, value in stats.items():
-        out[key_map.get(key, key)] = value
-    return out
-
-
 def _load_reward_effect_lookup(parser: EXMLParser, repo_root: Path) -> dict[str, dict[str, Any]]:
     """
     Build RewardID -> extracted effect stats from reward table when available.
@@ -142,16 +129,27 @@ def _load_reward_effect_lookup(parser: EXMLParser, repo_root: Path) -> dict[str,
     if reward_path is None:
         return {}
 
+    resolved_path = reward_path.resolve()
+    cache_key = (str(resolved_path), resolved_path.stat().st_mtime)
+    cached = _REWARD_EFFECT_LOOKUP_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     root = parser.load_xml(str(reward_path))
-    table_blocks = []
-    for table_name in ('GenericTable', 'DestructionTable', 'Table'):
-        table_blocks.extend(root.findall(f'.//Property[@name="{table_name}"]'))
+    # One walk over the tree, binned per table name; blocks keep the GenericTable,
+    # DestructionTable, Table order so later tables still win on duplicate IDs.
+    blocks_by_name: dict[str, list] = {'GenericTable': [], 'DestructionTable': [], 'Table': []}
+    for prop in root.iter('Property'):
+        bucket = blocks_by_name.get(prop.get('name'))
+        if bucket is not None:
+            bucket.append(prop)
+    table_blocks = [block for blocks in blocks_by_name.values() for block in blocks]
     if not table_blocks:
         return {}
 
     reward_lookup: dict[str, dict[str, Any]] = {}
     for table_prop in table_blocks:
-        for reward_entry in table_prop.findall('./Property'):
+        for reward_entry in parser.child_properties(table_prop):
             reward_id = (
                 parser.get_property_value(reward_entry, 'Id', '')
                 or parser.get_property_value(reward_entry, 'ID', '')
@@ -160,8 +158,9 @@ def _load_reward_effect_lookup(parser: EXMLParser, repo_root: Path) -> dict[str,
                 continue
             stats = _extract_reward_effect_stats(parser, reward_entry)
             reward_lookup[reward_id] = {
-                'RewardEffectStats': _humanize_reward_effect_stats(stats) if stats else None,
+                'RewardEffectStats': stats or None,
             }
+    _REWARD_EFFECT_LOOKUP_CACHE[cache_key] = reward_lookup
     return reward_lookup
 
 
@@ -171,7 +170,6 @@ def parse_cooking(mxml_path: str) -> list:
 
     This references product IDs from the Products table.
     """
-    root = EXMLParser.load_xml(mxml_path)
     parser = EXMLParser()
     localization = parser.load_localization()
     repo_root = Path(__file__).parent.parent
@@ -189,69 +187,66 @@ def parse_cooking(mxml_path: str) -> list:
 
     cooking_items = []
 
-    # Navigate to Table property
-    table_prop = root.find('.//Property[@name="Table"]')
-    if table_prop is None:
+    try:
+        for item_elem in parser.iter_table_rows(mxml_path, 'Table'):
+            try:
+                item_id = parser.get_property_value(item_elem, 'ID', '')
+                if not item_id:
+                    continue
+
+                # Look up in products
+                product_info = products_lookup.get(item_id)
+                if not product_info:
+                    continue  # Skip if not a food product
+                if not product_info.get('IconPath'):
+                    continue
+
+                reward_id = parser.get_property_value(item_elem, 'RewardID', '')
+                reward_effect = reward_effect_lookup.get(reward_id, {})
+
+                # Create cooking entry from product info (Icon from game path)
+                cooking = {
+                    'Id': item_id,
+                    'Icon': f"{item_id}.png",
+                    'IconPath': product_info.get('IconPath', ''),
+                    'Name': product_info['Name'],
+                    'Group': product_info['Group'],
+                    'Description': product_info['Description'],
+                    'BaseValueUnits': product_info['BaseValueUnits'],
+                    'CurrencyType': 'Credits',
+                    'MaxStackSize': product_info['MaxStackSize'],
+                    'Colour': product_info['Colour'],
+                    'CookingValue': product_info['CookingValue'],
+                    'CdnUrl': '',  # Build from Icon path: baseUrl + icon (e.g. EXTRACTED or your CDN)
+                    'Usages': product_info.get('Usages', []),
+                    'BlueprintCost': product_info.get('BlueprintCost', 0),
+                    'BlueprintCostType': 'None',
+                    'BlueprintSource': 0,
+                    'RequiredItems': product_info.get('RequiredItems', []),
+                    'StatBonuses': [],
+                    'ConsumableRewardTexts': [],
+                    'Rarity': product_info.get('Rarity'),
+                    'Legality': product_info.get('Legality'),
+                    'TradeCategory': product_info.get('TradeCategory'),
+                    'WikiCategory': product_info.get('WikiCategory'),
+                    'Consumable': product_info.get('Consumable'),
+                    'CookingIngredient': product_info.get('CookingIngredient'),
+                    'GoodForSelling': product_info.get('GoodForSelling'),
+                    'EggModifierIngredient': product_info.get('EggModifierIngredient'),
+                    'DeploysInto': product_info.get('DeploysInto'),
+                    'RewardID': reward_id or None,
+                    'EffectCategory': _map_effect_category(reward_id),
+                    'RewardEffectStats': reward_effect.get('RewardEffectStats'),
+                }
+
+                cooking_items.append(cooking)
+
+            except Exception as e:
+                print(f"Warning: Skipped cooking item due to error: {e}")
+                continue
+    except MissingTableError:
         print("Warning: Could not find Table property in MXML")
         return cooking_items
 
-    # Get all consumable IDs
-    for item_elem in table_prop.findall('./Property[@name="Table"]'):
-        try:
-            item_id = parser.get_property_value(item_elem, 'ID', '')
-            if not item_id:
-                continue
-
-            # Look up in products
-            product_info = products_lookup.get(item_id)
-            if not product_info:
-                continue  # Skip if not a food product
-            if not product_info.get('IconPath'):
-                continue
-
-            reward_id = parser.get_property_value(item_elem, 'RewardID', '')
-            reward_effect = reward_effect_lookup.get(reward_id, {})
-
-            # Create cooking entry from product info (Icon from game path)
-            cooking = {
-                'Id': item_id,
-                'Icon': f"{item_id}.png",
-                'IconPath': product_info.get('IconPath', ''),
-                'Name': product_info['Name'],
-                'Group': product_info['Group'],
-                'Description': product_info['Description'],
-                'BaseValueUnits': product_info['BaseValueUnits'],
-                'CurrencyType': 'Credits',
-                'MaxStackSize': product_info['MaxStackSize'],
-                'Colour': product_info['Colour'],
-                'CookingValue': product_info['CookingValue'],
-                'CdnUrl': '',  # Build from Icon path: baseUrl + icon (e.g. EXTRACTED or your CDN)
-                'Usages': product_info.get('Usages', []),
-                'BlueprintCost': product_info.get('BlueprintCost', 0),
-                'BlueprintCostType': 'None',
-                'BlueprintSource': 0,
-                'RequiredItems': product_info.get('RequiredItems', []),
-                'StatBonuses': [],
-                'ConsumableRewardTexts': [],
-                'Rarity': product_info.get('Rarity'),
-                'Legality': product_info.get('Legality'),
-                'TradeCategory': product_info.get('TradeCategory'),
-                'WikiCategory': product_info.get('WikiCategory'),
-                'Consumable': product_info.get('Consumable'),
-                'CookingIngredient': product_info.get('CookingIngredient'),
-                'GoodForSelling': product_info.get('GoodForSelling'),
-                'EggModifierIngredient': product_info.get('EggModifierIngredient'),
-                'DeploysInto': product_info.get('DeploysInto'),
-                'RewardID': reward_id or None,
-                'EffectCategory': _map_effect_category(reward_id),
-                'RewardEffectStats': reward_effect.get('RewardEffectStats'),
-            }
-
-            cooking_items.append(cooking)
-
-        except Exception as e:
-            print(f"Warning: Skipped cooking item due to error: {e}")
-            continue
-
     print(f"[OK] Parsed {len(cooking_items)} cooking items")
     return cooking_items
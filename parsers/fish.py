@@ -6,15 +6,49 @@ locale MBINs from the game, run MBINCompiler to get MXML, then add them to
 utils/localization.py and rebuild localization.json.
 """
 import re
+import sys
 from .base_parser import (
     EXMLParser,
+    MissingTableError,
 )
 from .product_lookup import load_product_lookup
 from pathlib import Path
 
-
-# Cache for product details (from game MXML)
-_product_cache = None
+_SIZE_TOKEN_BEFORE_WORD_RE = re.compile(r'%SIZE%(?=[A-Za-z])')
+
+_FISH_SIZE_SUFFIX = {
+    'Small': 'S',
+    'Medium': 'M',
+    'Large': 'L',
+    'ExtraLarge': 'XL',
+}
+
+_FISH_RARITY_SUFFIX = {
+    'Common': 'COM',
+    'Rare': 'RARE',
+    'Epic': 'EPIC',
+    'Legendary': 'EPIC',  # Reuse epic rarity template, then append legend note.
+}
+
+_FISH_BIOME_SUFFIX = {
+    'All': 'ALL',
+    'Lush': 'LUSH',
+    'Scorched': 'HOT',
+    'Lava': 'HOT',
+    'Frozen': 'COLD',
+    'Radioactive': 'RAD',
+    'Toxic': 'TOX',
+    'Swamp': 'TOX',
+    'Barren': 'DUST',
+    'Dead': 'DUST',
+    'Weird': 'ODD',
+    'Red': 'ODD',
+    'Green': 'ODD',
+    'Blue': 'ODD',
+    'Test': 'ODD',
+    'Waterworld': 'DEEP',
+    'GasGiant': 'GAS',
+}
 
 
 def _replace_size_token(text: str, size_word: str) -> str:
@@ -23,11 +57,17 @@ def _replace_size_token(text: str, size_word: str) -> str:
         return ''
     if not size_word:
         return text.replace('%SIZE%', '').strip()
+    if '%SIZE%' not in text:
+        return text
     # Handle malformed cases like "%SIZE%An ..." by inserting a space.
-    text = re.sub(r'%SIZE%(?=[A-Za-z])', f'{size_word} ', text)
+    text = _SIZE_TOKEN_BEFORE_WORD_RE.sub(f'{size_word} ', text)
     return text.replace('%SIZE%', size_word)
 
 
+# (localization dict the entries were built from, (quality, size, biomes) -> description)
+_FALLBACK_DESCRIPTIONS: tuple[dict | None, dict[tuple, str]] = (None, {})
+
+
 def _build_fish_fallback_description(
     parser: EXMLParser,
     quality: str,
@@ -36,49 +76,32 @@ def _build_fish_fallback_description(
 ) -> str:
     """
     Build fish description from generic rarity/biome localization templates.
+    Memoised per (quality, size, biomes) for the current localization dict.
     """
+    global _FALLBACK_DESCRIPTIONS
     loc = parser.load_localization()
+    # Biome order matters (the first biome with a template wins), so the key keeps it.
+    cache_key = (quality, fish_size, tuple(biomes or ()))
+    if _FALLBACK_DESCRIPTIONS[0] is not loc:
+        _FALLBACK_DESCRIPTIONS = (loc, {})
+    cached = _FALLBACK_DESCRIPTIONS[1].get(cache_key)
+    if cached is None:
+        cached = _FALLBACK_DESCRIPTIONS[1][cache_key] = _compose_fish_fallback_description(
+            loc, quality, fish_size, biomes
+        )
+    return cached
+
 
-    size_suffix = {
-        'Small': 'S',
-        'Medium': 'M',
-        'Large': 'L',
-        'ExtraLarge': 'XL',
-    }.get(fish_size, 'M')
-
-    rarity_suffix = {
-        'Common': 'COM',
-        'Rare': 'RARE',
-        'Epic': 'EPIC',
-        'Legendary': 'EPIC',  # Reuse epic rarity template, then append legend note.
-    }.get(quality, '')
-
-    biome_to_suffix = {
-        'All': 'ALL',
-        'Lush': 'LUSH',
-        'Scorched': 'HOT',
-        'Lava': 'HOT',
-        'Frozen': 'COLD',
-        'Radioactive': 'RAD',
-        'Toxic': 'TOX',
-        'Swamp': 'TOX',
-        'Barren': 'DUST',
-        'Dead': 'DUST',
-        'Weird': 'ODD',
-        'Red': 'ODD',
-        'Green': 'ODD',
-        'Blue': 'ODD',
-        'Test': 'ODD',
-        'Waterworld': 'DEEP',
-        'GasGiant': 'GAS',
-    }
+def _compose_fish_fallback_description(loc: dict, quality: str, fish_size: str, biomes: list[str]) -> str:
+    size_suffix = _FISH_SIZE_SUFFIX.get(fish_size, 'M')
+    rarity_suffix = _FISH_RARITY_SUFFIX.get(quality, '')
 
     size_word = loc.get(f'UI_FISH_SIZE_{size_suffix}', '').strip()
     rarity_desc = loc.get(f'UI_FISH_RARITY_{rarity_suffix}_{size_suffix}_DESC', '').strip() if rarity_suffix else ''
 
     biome_desc = ''
     for biome in biomes or []:
-        suffix = biome_to_suffix.get(biome)
+        suffix = _FISH_BIOME_SUFFIX.get(biome)
         if not suffix:
             continue
         candidate = loc.get(f'UI_FISH_BIOME_{suffix}_DESC', '').strip()
@@ -98,26 +121,20 @@ def _build_fish_fallback_description(
 
 
 def _load_product_details():
-    """Load product details for fish ProductIDs"""
-    global _product_cache
-    if _product_cache is not None:
-        return _product_cache
-
-    _product_cache = {}
+    """Load product details for fish ProductIDs (memoised by load_product_lookup)"""
     parser = EXMLParser()
     localization = parser.load_localization()
 
     products_path = Path(__file__).parent.parent / 'data' / 'mbin' / 'nms_reality_gcproducttable.MXML'
-    if products_path.exists():
-        _product_cache = load_product_lookup(
-            parser=parser,
-            localization=localization,
-            products_mxml_path=products_path,
-            include_requirements=False,
-        )
+    products = load_product_lookup(
+        parser=parser,
+        localization=localization,
+        products_mxml_path=products_path,
+        include_requirements=False,
+    )
 
-    print(f"[OK] Loaded {len(_product_cache)} product details for lookup")
-    return _product_cache
+    print(f"[OK] Loaded {len(products)} product details for lookup")
+    return products
 
 
 def parse_fish(mxml_path: str) -> list:
@@ -126,7 +143,6 @@ def parse_fish(mxml_path: str) -> list:
 
     Fish table references ProductIDs that need to be looked up in Products table.
     """
-    root = EXMLParser.load_xml(mxml_path)
     parser = EXMLParser()
     parser.load_localization()
 
@@ -135,100 +151,103 @@ def parse_fish(mxml_path: str) -> list:
     fish_list = []
     fish_counter = 1
 
-    # Navigate to Fish property
-    fish_prop = root.find('.//Property[@name="Fish"]')
-    if fish_prop is None:
+    # Local aliases for the per-fish field reads.
+    get_value = parser.get_property_value
+    get_nested_enum = parser.get_nested_enum
+    parse_value = parser.parse_value
+    try:
+        for fish_elem in parser.iter_table_rows(mxml_path, 'Fish'):
+            try:
+                # Get ProductID to look up details
+                product_id = get_value(fish_elem, 'ProductID', '')
+                if not product_id:
+                    continue
+
+                # From fishdatatable: Quality (rarity), Size, Time (fishing time)
+                # Interned: these enum values repeat across every fish row.
+                quality = sys.intern(get_nested_enum(fish_elem, 'Quality', 'ItemQuality', ''))
+                fish_size = sys.intern(get_nested_enum(fish_elem, 'Size', 'FishSize', ''))
+                fishing_time = sys.intern(get_nested_enum(fish_elem, 'Time', 'FishingTime', ''))
+                needs_storm = parse_value(get_value(fish_elem, 'NeedsStorm', 'false'))
+                requires_mission_active = get_value(fish_elem, 'RequiresMissionActive', '') or None
+                mission_seed = get_value(fish_elem, 'MissionSeed', '') or None
+                mission_must_also_be_selected = parse_value(
+                    get_value(fish_elem, 'MissionMustAlsoBeSelected', 'false')
+                )
+                mission_catch_chance_override = parse_value(
+                    get_value(fish_elem, 'MissionCatchChanceOverride', '0')
+                )
+                catch_increments_stat = get_value(fish_elem, 'CatchIncrementsStat', '') or None
+
+                biome_flags = {}
+                biome_prop = parser.find_child_property(fish_elem, 'Biome')
+                if biome_prop is not None:
+                    for biome in parser.child_properties(biome_prop):
+                        biome_name = biome.get('name')
+                        biome_val = biome.get('value', 'false')
+                        if biome_name:
+                            biome_flags[biome_name] = parse_value(biome_val)
+                biomes = [name for name, enabled in biome_flags.items() if enabled]
+
+                # Get product details (name, description, group from product table + localization)
+                product_details = products.get(product_id, {})
+                if not product_details.get('IconPath'):
+                    continue
+
+                name = product_details.get('Name', product_id)
+                group = product_details.get('Group', '')
+                description = product_details.get('Description', '')
+                if not (description or '').strip():
+                    description = _build_fish_fallback_description(
+                        parser=parser,
+                        quality=quality,
+                        fish_size=fish_size,
+                        biomes=biomes,
+                    )
+                fish = {
+                    'Id': product_id,
+                    'Icon': f"{product_id}.png",
+                    'IconPath': product_details.get('IconPath', ''),
+                    'Name': name,
+                    'Group': group,
+                    'Description': description,
+                    'Quality': quality,
+                    'FishSize': fish_size,
+                    'FishingTime': fishing_time,
+                    'Biomes': biomes,
+                    'NeedsStorm': needs_storm,
+                    'RequiresMissionActive': requires_mission_active,
+                    'MissionSeed': mission_seed,
+                    'MissionMustAlsoBeSelected': mission_must_also_be_selected,
+                    'MissionCatchChanceOverride': mission_catch_chance_override,
+                    'CatchIncrementsStat': catch_increments_stat,
+                    'BaseValueUnits': product_details.get('BaseValueUnits', 0),
+                    'CurrencyType': 'Credits',
+                    'MaxStackSize': product_details.get('MaxStackSize', 1),
+                    'Colour': product_details.get('Colour', 'FFFFFF'),
+                    'CookingValue': product_details.get('CookingValue', 0),
+                    'Usages': [],
+                    'BlueprintCost': 0,
+                    'BlueprintCostType': 'None',
+                    'BlueprintSource': 0,
+                    'RequiredItems': [],
+                    'StatBonuses': [],
+                    'ConsumableRewardTexts': [],
+                    'Rarity': product_details.get('Rarity'),
+                    'Legality': product_details.get('Legality'),
+                    'TradeCategory': product_details.get('TradeCategory'),
+                    'WikiCategory': product_details.get('WikiCategory'),
+                    'Consumable': product_details.get('Consumable'),
+                }
+                fish_list.append(fish)
+                fish_counter += 1
+
+            except Exception as e:
+                print(f"Warning: Skipped fish due to error: {e}")
+                continue
+    except MissingTableError:
         print("Warning: Could not find Fish property in MXML")
         return fish_list
 
-    for fish_elem in fish_prop.findall('./Property[@name="Fish"]'):
-        try:
-            # Get ProductID to look up details
-            product_id = parser.get_property_value(fish_elem, 'ProductID', '')
-            if not product_id:
-                continue
-
-            # From fishdatatable: Quality (rarity), Size, Time (fishing time)
-            quality = parser.get_nested_enum(fish_elem, 'Quality', 'ItemQuality', '')
-            fish_size = parser.get_nested_enum(fish_elem, 'Size', 'FishSize', '')
-            fishing_time = parser.get_nested_enum(fish_elem, 'Time', 'FishingTime', '')
-            needs_storm = parser.parse_value(parser.get_property_value(fish_elem, 'NeedsStorm', 'false'))
-            requires_mission_active = parser.get_property_value(fish_elem, 'RequiresMissionActive', '') or None
-            mission_seed = parser.get_property_value(fish_elem, 'MissionSeed', '') or None
-            mission_must_also_be_selected = parser.parse_value(
-                parser.get_property_value(fish_elem, 'MissionMustAlsoBeSelected', 'false')
-            )
-            mission_catch_chance_override = parser.parse_value(
-                parser.get_property_value(fish_elem, 'MissionCatchChanceOverride', '0')
-            )
-            catch_increments_stat = parser.get_property_value(fish_elem, 'CatchIncrementsStat', '') or None
-
-            biome_flags = {}
-            biome_prop = fish_elem.find('./Property[@name="Biome"]')
-            if biome_prop is not None:
-                for biome in biome_prop.findall('./Property'):
-                    biome_name = biome.get('name')
-                    biome_val = biome.get('value', 'false')
-                    if biome_name:
-                        biome_flags[biome_name] = parser.parse_value(biome_val)
-            biomes = [name for name, enabled in biome_flags.items() if enabled]
-
-            # Get product details (name, description, group from product table + localization)
-            product_details = products.get(product_id, {})
-            if not product_details.get('IconPath'):
-                continue
-
-            name = product_details.get('Name', product_id)
-            group = product_details.get('Group', '')
-            description = product_details.get('Description', '')
-            if not (description or '').strip():
-                description = _build_fish_fallback_description(
-                    parser=parser,
-                    quality=quality,
-                    fish_size=fish_size,
-                    biomes=biomes,
-                )
-            fish = {
-                'Id': product_id,
-                'Icon': f"{product_id}.png",
-                'IconPath': product_details.get('IconPath', ''),
-                'Name': name,
-                'Group': group,
-                'Description': description,
-                'Quality': quality,
-                'FishSize': fish_size,
-                'FishingTime': fishing_time,
-                'Biomes': biomes,
-                'NeedsStorm': needs_storm,
-                'RequiresMissionActive': requires_mission_active,
-                'MissionSeed': mission_seed,
-                'MissionMustAlsoBeSelected': mission_must_also_be_selected,
-                'MissionCatchChanceOverride': mission_catch_chance_override,
-                'CatchIncrementsStat': catch_increments_stat,
-                'BaseValueUnits': product_details.get('BaseValueUnits', 0),
-                'CurrencyType': 'Credits',
-                'MaxStackSize': product_details.get('MaxStackSize', 1),
-                'Colour': product_details.get('Colour', 'FFFFFF'),
-                'CookingValue': product_details.get('CookingValue', 0),
-                'Usages': [],
-                'BlueprintCost': 0,
-                'BlueprintCostType': 'None',
-                'BlueprintSource': 0,
-                'RequiredItems': [],
-                'StatBonuses': [],
-                'ConsumableRewardTexts': [],
-                'Rarity': product_details.get('Rarity'),
-                'Legality': product_details.get('Legality'),
-                'TradeCategory': product_details.get('TradeCategory'),
-                'WikiCategory': product_details.get('WikiCategory'),
-                'Consumable': product_details.get('Consumable'),
-            }
-            fish_list.append(fish)
-            fish_counter += 1
-
-        except Exception as e:
-            print(f"Warning: Skipped fish due to error: {e}")
-            continue
-
     print(f"[OK] Parsed {len(fish_list)} fish")
     return fish_list
@@ -1,6 +1,8 @@
 """Parser for procedural technology upgrades (upgrade modules)."""
+import sys
+from functools import lru_cache
 from pathlib import Path
-from .base_parser import EXMLParser, format_stat_type_name, normalize_game_icon_path
+from .base_parser import EXMLParser, MissingTableError, format_stat_type_name, normalize_game_icon_path
 
 # Mapping of procedural tech categories to groups
 # These are upgrade modules that go into TechnologyModule or ConstructedTechnology
@@ -11,15 +13,29 @@ QUALITY_PREFIX = {
     'Legendary': 'S-Class',
 }
 
+# Group-name fragments that mark an upgrade as a "Node" rather than an "Upgrade".
+_NODE_GROUP_MARKERS = ('Node', 'Eyes', 'Assembly', 'Heart', 'Suppressor', 'Cortex', 'Vents')
+
+
+@lru_cache(maxsize=1024)
+def _procedural_group(quality: str, group_name: str) -> str:
+    """Display group, e.g. 'S-Class Hyperdrive Upgrade'; many tech IDs share one (quality, group)."""
+    # Build the full group with quality prefix for the specific tech type
+    full_group = f'{QUALITY_PREFIX.get(quality, quality)} {group_name}'
+    # Add "Upgrade" or "Node" suffix based on name pattern
+    if any(marker in group_name for marker in _NODE_GROUP_MARKERS):
+        return f'{full_group} Node'
+    return f'{full_group} Upgrade'
+
 
 def _parse_procedural_stat_levels(parser: EXMLParser, tech_elem) -> list[dict]:
     """Extract procedural roll ranges from StatLevels."""
     stat_levels = []
-    stat_levels_prop = tech_elem.find('.//Property[@name="StatLevels"]')
+    stat_levels_prop = parser.find_child_property(tech_elem, 'StatLevels')
     if stat_levels_prop is None:
         return stat_levels
 
-    for stat_elem in stat_levels_prop.findall('./Property[@name="StatLevels"]'):
+    for stat_elem in stat_levels_prop.iterfind('./Property[@name="StatLevels"]'):
         stat_type = parser.get_nested_enum(stat_elem, 'Stat', 'StatsType', '')
         value_min = parser.parse_value(parser.get_property_value(stat_elem, 'ValueMin', '0'))
         value_max = parser.parse_value(parser.get_property_value(stat_elem, 'ValueMax', '0'))
@@ -59,15 +75,15 @@ def _load_template_icon_map(procedural_mxml_path: str) -> dict[str, str]:
     parser = EXMLParser()
     template_icons: dict[str, str] = {}
 
-    table_prop = tech_root.find('.//Property[@name="Table"]')
+    table_prop = parser.find_property(tech_root, 'Table')
     if table_prop is None:
         return template_icons
 
-    for tech_elem in table_prop.findall('./Property[@name="Table"]'):
+    for tech_elem in table_prop.iterfind('./Property[@name="Table"]'):
         template_id = parser.get_property_value(tech_elem, 'ID', '')
         if not template_id:
             continue
-        icon_prop = tech_elem.find('.//Property[@name="Icon"]')
+        icon_prop = parser.find_child_property(tech_elem, 'Icon')
         icon_filename = (
             parser.get_property_value(icon_prop, 'Filename', '')
             if icon_prop is not None
@@ -97,7 +113,6 @@ def parse_procedural_tech(mxml_path: str) -> list:
     Returns:
         List of procedural technology dictionaries
     """
-    root = EXMLParser.load_xml(mxml_path)
     parser = EXMLParser()
 
     # Load localization
@@ -107,81 +122,71 @@ def parse_procedural_tech(mxml_path: str) -> list:
 
     template_icon_map = _load_template_icon_map(mxml_path)
 
-    # Navigate to Table property
-    table_prop = root.find('.//Property[@name="Table"]')
-    if table_prop is None:
+    # Each tech is a Property element with value="GcProceduralTechnologyData"
+    try:
+        for tech_elem in parser.iter_table_rows(mxml_path, 'Table'):
+            try:
+                # Extract basic info
+                tech_id = parser.get_property_value(tech_elem, 'ID', '')
+                group_key = parser.get_property_value(tech_elem, 'Group', '')
+                name_key = parser.get_property_value(tech_elem, 'Name', '')
+                desc_key = parser.get_property_value(tech_elem, 'Description', '')
+                template_id = parser.get_property_value(tech_elem, 'Template', '')
+                quality = sys.intern(parser.get_property_value(tech_elem, 'Quality', 'Normal'))
+                num_stats_min = parser.parse_value(parser.get_property_value(tech_elem, 'NumStatsMin', '0'))
+                num_stats_max = parser.parse_value(parser.get_property_value(tech_elem, 'NumStatsMax', '0'))
+                weighting_curve = sys.intern(parser.get_nested_enum(tech_elem, 'WeightingCurve', 'WeightingCurve', ''))
+                stat_levels = _parse_procedural_stat_levels(parser, tech_elem)
+
+                # Translate name and description
+                has_name_translation = bool(name_key and name_key in localization)
+                name = parser.translate(name_key) or name_key
+                description = parser.translate(desc_key) or ''
+
+                # Get the base group/name from Group key
+                group_name = parser.translate(group_key) or tech_id
+
+                group = _procedural_group(quality, group_name)
+
+                # For internal keys without localization (e.g. AP_HYPERDRIVE), prefer
+                # readable translated group names over fallback key prettification.
+                if not has_name_translation and group_name and group_name != tech_id:
+                    name = group_name
+
+                # Prefer direct icon from procedural entry; fallback to template icon.
+                icon_prop = parser.find_child_property(tech_elem, 'Icon')
+                icon_filename = (
+                    parser.get_property_value(icon_prop, 'Filename', '')
+                    if icon_prop is not None
+                    else ''
+                )
+                icon_path = normalize_game_icon_path(icon_filename) if icon_filename else ''
+                if not icon_path and template_id:
+                    icon_path = template_icon_map.get(template_id, '')
+
+                # Build technology dict
+                technology = {
+                    'Id': tech_id,
+                    'Icon': f'{tech_id}.png',
+                    'IconPath': icon_path,
+                    'Name': name,
+                    'Group': group,
+                    'Description': description,
+                    'Quality': quality,
+                    'NumStatsMin': num_stats_min,
+                    'NumStatsMax': num_stats_max,
+                    'WeightingCurve': weighting_curve,
+                    'StatLevels': stat_levels,
+                }
+
+                technologies.append(technology)
+
+            except Exception as e:
+                print(f"Warning: Error parsing procedural tech: {e}")
+                continue
+    except MissingTableError:
         print("Warning: Could not find Table property in MXML")
         return technologies
 
-    # Each tech is a Property element with value="GcProceduralTechnologyData"
-    for tech_elem in table_prop.findall('./Property[@name="Table"]'):
-        try:
-            # Extract basic info
-            tech_id = parser.get_property_value(tech_elem, 'ID', '')
-            group_key = parser.get_property_value(tech_elem, 'Group', '')
-            name_key = parser.get_property_value(tech_elem, 'Name', '')
-            desc_key = parser.get_property_value(tech_elem, 'Description', '')
-            template_id = parser.get_property_value(tech_elem, 'Template', '')
-            quality = parser.get_property_value(tech_elem, 'Quality', 'Normal')
-            num_stats_min = parser.parse_value(parser.get_property_value(tech_elem, 'NumStatsMin', '0'))
-            num_stats_max = parser.parse_value(parser.get_property_value(tech_elem, 'NumStatsMax', '0'))
-            weighting_curve = parser.get_nested_enum(tech_elem, 'WeightingCurve', 'WeightingCurve', '')
-            stat_levels = _parse_procedural_stat_levels(parser, tech_elem)
-
-            # Translate name and description
-            has_name_translation = bool(name_key and name_key in localization)
-            name = parser.translate(name_key) or name_key
-            description = parser.translate(desc_key) or ''
-
-            # Get the base group/name from Group key
-            group_name = parser.translate(group_key) or tech_id
-
-            # Build the full group with quality prefix for the specific tech type
-            quality_prefix = QUALITY_PREFIX.get(quality, quality)
-            full_group = f'{quality_prefix} {group_name}'
-
-            # Add "Upgrade" or "Node" suffix based on name pattern
-            if 'Node' in group_name or any(x in group_name for x in ['Eyes', 'Assembly', 'Heart', 'Suppressor', 'Cortex', 'Vents']):
-                group = f'{full_group} Node'
-            else:
-                group = f'{full_group} Upgrade'
-
-            # For internal keys without localization (e.g. AP_HYPERDRIVE), prefer
-            # readable translated group names over fallback key prettification.
-            if not has_name_translation and group_name and group_name != tech_id:
-                name = group_name
-
-            # Prefer direct icon from procedural entry; fallback to template icon.
-            icon_prop = tech_elem.find('.//Property[@name="Icon"]')
-            icon_filename = (
-                parser.get_property_value(icon_prop, 'Filename', '')
-                if icon_prop is not None
-                else ''
-            )
-            icon_path = normalize_game_icon_path(icon_filename) if icon_filename else ''
-            if not icon_path and template_id:
-                icon_path = template_icon_map.get(template_id, '')
-
-            # Build technology dict
-            technology = {
-                'Id': tech_id,
-                'Icon': f'{tech_id}.png',
-                'IconPath': icon_path,
-                'Name': name,
-                'Group': group,
-                'Description': description,
-                'Quality': quality,
-                'NumStatsMin': num_stats_min,
-                'NumStatsMax': num_stats_max,
-                'WeightingCurve': weighting_curve,
-                'StatLevels': stat_levels,
-            }
-
-            technologies.append(technology)
-
-        except Exception as e:
-            print(f"Warning: Error parsing procedural tech: {e}")
-            continue
-
     print(f"[OK] Parsed {len(technologies)} procedural technology upgrades")
     return technologies
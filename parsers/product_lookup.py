@@ -1,9 +1,18 @@
 """Shared product-table lookup helpers for parser modules."""
+import sys
 from pathlib import Path
 
 from .base_parser import EXMLParser, normalize_game_icon_path, unresolved_localization_key_count
 
 _PRODUCT_LOOKUP_CACHE: dict[tuple[str, float, bool, bool], dict[str, dict]] = {}
+# Product ID -> icon path for every row (including rows the lookup skips), keyed by (path, mtime).
+_PRODUCT_ICON_LOOKUP_CACHE: dict[tuple[str, float], dict[str, str]] = {}
+
+
+def _product_icon_path(parser: EXMLParser, item) -> str:
+    icon_prop = parser.find_child_property(item, 'Icon')
+    icon_filename = parser.get_property_value(icon_prop, 'Filename', '') if icon_prop is not None else ''
+    return normalize_game_icon_path(icon_filename) if icon_filename else ''
 
 
 def parse_product_element(
@@ -23,42 +32,46 @@ def parse_product_element(
     Parse one product-table row into a normalized intermediate dictionary.
     Returns None when the row should be skipped.
     """
-    item_id = parser.get_property_value(item, 'ID', fallback_id)
+    # Local aliases for the ~15 field reads below; this runs once per product-table row.
+    get_value = parser.get_property_value
+    parse_value = parser.parse_value
+
+    item_id = get_value(item, 'ID', fallback_id)
     if not item_id:
         return None
 
-    name_key = parser.get_property_value(item, 'Name', '')
-    subtitle_key = parser.get_property_value(item, 'Subtitle', '')
-    description_key = parser.get_property_value(item, 'Description', '')
+    name_key = get_value(item, 'Name', '')
+    subtitle_key = get_value(item, 'Subtitle', '')
+    description_key = get_value(item, 'Description', '')
     if unresolved_localization_key_count(localization, name_key, subtitle_key, description_key) >= 2:
         return None
 
-    base_value = parser.parse_value(parser.get_property_value(item, 'BaseValue', '0'))
-    stack_mult = parser.parse_value(parser.get_property_value(item, 'StackMultiplier', '1'))
-    recipe_cost = parser.parse_value(parser.get_property_value(item, 'RecipeCost', '0'))
-    cooking_value = parser.parse_value(parser.get_property_value(item, 'CookingValue', '0'))
+    base_value = parse_value(get_value(item, 'BaseValue', '0'))
+    stack_mult = parse_value(get_value(item, 'StackMultiplier', '1'))
+    recipe_cost = parse_value(get_value(item, 'RecipeCost', '0'))
+    cooking_value = parse_value(get_value(item, 'CookingValue', '0'))
 
     required_items = []
     if include_requirements:
-        requirements_prop = item.find('.//Property[@name="Requirements"]')
+        requirements_prop = parser.find_child_property(item, 'Requirements')
         if requirements_prop is not None:
-            for req_elem in requirements_prop.findall('./Property'):
-                req_id = parser.get_property_value(req_elem, 'ID', '')
-                req_amount = parser.get_property_value(req_elem, 'Amount', '1')
+            for req_elem in parser.child_properties(requirements_prop):
+                req_id = get_value(req_elem, 'ID', '')
+                req_amount = get_value(req_elem, 'Amount', '1')
                 if req_id:
                     required_items.append({
                         'Id': req_id,
-                        'Quantity': parser.parse_value(req_amount),
+                        'Quantity': parse_value(req_amount),
                     })
 
-    is_craftable = parser.get_property_value(item, 'IsCraftable', 'false')
-    is_cooking = parser.get_property_value(item, 'CookingIngredient', 'false')
-    egg_modifier = parser.get_property_value(item, 'EggModifierIngredient', 'false')
-    good_for_selling = parser.get_property_value(item, 'GoodForSelling', 'false')
-    is_craftable_bool = parser.parse_value(is_craftable)
-    is_cooking_bool = parser.parse_value(is_cooking)
-    egg_modifier_bool = parser.parse_value(egg_modifier)
-    good_for_selling_bool = parser.parse_value(good_for_selling)
+    is_craftable = get_value(item, 'IsCraftable', 'false')
+    is_cooking = get_value(item, 'CookingIngredient', 'false')
+    egg_modifier = get_value(item, 'EggModifierIngredient', 'false')
+    good_for_selling = get_value(item, 'GoodForSelling', 'false')
+    is_craftable_bool = parse_value(is_craftable)
+    is_cooking_bool = parse_value(is_cooking)
+    egg_modifier_bool = parse_value(egg_modifier)
+    good_for_selling_bool = parse_value(good_for_selling)
 
     usages = []
     if is_craftable_bool:
@@ -70,19 +83,18 @@ def parse_product_element(
     if good_for_selling_bool:
         usages.append('HasDevProperties')
 
-    rarity = parser.get_nested_enum(item, 'Rarity', 'Rarity', '')
-    legality = parser.get_nested_enum(item, 'Legality', 'Legality', '')
-    trade_category = parser.get_nested_enum(item, 'TradeCategory', 'TradeCategory', '')
-    wiki_category = parser.get_property_value(item, 'WikiCategory', '')
-    consumable = parser.parse_value(parser.get_property_value(item, 'Consumable', 'false'))
-    deploys_into = parser.get_property_value(item, 'DeploysInto', '')
+    # Enum values repeat across thousands of rows; intern them so every row shares one string.
+    rarity = sys.intern(parser.get_nested_enum(item, 'Rarity', 'Rarity', ''))
+    legality = sys.intern(parser.get_nested_enum(item, 'Legality', 'Legality', ''))
+    trade_category = sys.intern(parser.get_nested_enum(item, 'TradeCategory', 'TradeCategory', ''))
+    wiki_category = sys.intern(get_value(item, 'WikiCategory', ''))
+    consumable = parse_value(get_value(item, 'Consumable', 'false'))
+    deploys_into = get_value(item, 'DeploysInto', '')
 
-    colour_elem = item.find('.//Property[@name="Colour"]')
+    colour_elem = parser.find_child_property(item, 'Colour')
     colour = parser.parse_colour(colour_elem)
 
-    icon_prop = item.find('.//Property[@name="Icon"]')
-    icon_filename = parser.get_property_value(icon_prop, 'Filename', '') if icon_prop is not None else ''
-    icon_path = normalize_game_icon_path(icon_filename) if icon_filename else ''
+    icon_path = _product_icon_path(parser, item)
     if require_icon and not icon_path:
         return None
 
@@ -124,7 +136,12 @@ def load_product_lookup(
     include_requirements: bool = True,
     include_raw_keys: bool = False,
 ) -> dict[str, dict]:
-    """Load product table rows into a normalized lookup keyed by product ID."""
+    """
+    Load product table rows into a normalized lookup keyed by product ID.
+    Memoised per (path, mtime, flags). A lookup built with requirements also serves callers
+    that do not ask for them (their rows then carry RequiredItems they can ignore), so
+    cooking, fish and trade share one pass over the product table.
+    """
     path = Path(products_mxml_path)
     if not path.exists():
         return {}
@@ -136,16 +153,19 @@ def load_product_lookup(
         include_raw_keys,
     )
     cached = _PRODUCT_LOOKUP_CACHE.get(cache_key)
+    if cached is None and not include_requirements:
+        cached = _PRODUCT_LOOKUP_CACHE.get(cache_key[:2] + (True, include_raw_keys))
     if cached is not None:
         return cached
 
     root = parser.load_xml(str(path))
-    table_prop = root.find('.//Property[@name="Table"]')
+    table_prop = parser.find_property(root, 'Table')
     if table_prop is None:
         return {}
 
     lookup: dict[str, dict] = {}
-    for item in table_prop.findall('./Property[@name="Table"]'):
+    icon_lookup: dict[str, str] = {}
+    for item in parser.child_properties(table_prop, 'Table'):
         row = parse_product_element(
             parser=parser,
             localization=localization,
@@ -159,8 +179,44 @@ def load_product_lookup(
             description_default="",
         )
         if row is None:
+            # Skipped rows still count for icon overrides (e.g. building IconOverrideProductID).
+            icon_path = _product_icon_path(parser, item)
+            if icon_path:
+                icon_lookup[parser.get_property_value(item, 'ID', '')] = icon_path
             continue
+        if row['IconPath']:
+            icon_lookup[row['Id']] = row['IconPath']
         lookup[row['Id']] = row
 
     _PRODUCT_LOOKUP_CACHE[cache_key] = lookup
+    _PRODUCT_ICON_LOOKUP_CACHE.setdefault(cache_key[:2], icon_lookup)
     return lookup
+
+
+def load_product_icon_lookup(*, parser: EXMLParser, products_mxml_path: str | Path) -> dict[str, str]:
+    """
+    Product ID -> normalized icon path for every product-table row.
+    Shares the product-table pass with load_product_lookup when that already ran.
+    """
+    path = Path(products_mxml_path)
+    if not path.exists():
+        return {}
+    resolved_path = path.resolve()
+    cache_key = (str(resolved_path), resolved_path.stat().st_mtime)
+    cached = _PRODUCT_ICON_LOOKUP_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    root = parser.load_xml(str(path))
+    table_prop = parser.find_property(root, 'Table')
+    if table_prop is None:
+        return {}
+
+    icon_lookup: dict[str, str] = {}
+    for item in parser.child_properties(table_prop, 'Table'):
+        icon_path = _product_icon_path(parser, item)
+        if icon_path:
+            icon_lookup[parser.get_property_value(item, 'ID', '')] = icon_path
+
+    _PRODUCT_ICON_LOOKUP_CACHE[cache_key] = icon_lookup
+    return icon_lookup
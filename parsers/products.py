@@ -52,7 +52,7 @@ def parse_products(mxml_path: str, *, include_subtitle_key: bool = False) -> lis
         return products
 
     # Each product is a Property element with value="GcProductData"
-    for product_elem in table_prop.findall('./Property[@name="Table"]'):
+    for product_elem in table_prop.iterfind('./Property[@name="Table"]'):
         try:
             fallback_id = f'PRODUCT_{product_counter}'
             name_key = parser.get_property_value(product_elem, 'Name', '')
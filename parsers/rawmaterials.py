@@ -24,7 +24,7 @@ def parse_rawmaterials(mxml_path: str) -> list:
         print("Warning: Could not find Table property in MXML")
         return materials
 
-    for item_elem in table_prop.findall('./Property[@name="Table"]'):
+    for item_elem in table_prop.iterfind('./Property[@name="Table"]'):
         try:
             # Extract basic info
             item_id = parser.get_property_value(item_elem, 'ID', f'SUBSTANCE_{material_counter}')
@@ -40,7 +40,7 @@ def parse_rawmaterials(mxml_path: str) -> list:
             description = parser.translate(description_key, description_key)
 
             # Extract Icon path from game (matches data/EXTRACTED/textures/...)
-            icon_prop = item_elem.find('.//Property[@name="Icon"]')
+            icon_prop = parser.find_child_property(item_elem, 'Icon')
             icon_filename = ''
             if icon_prop is not None:
                 icon_filename = parser.get_property_value(icon_prop, 'Filename', '')
@@ -49,7 +49,7 @@ def parse_rawmaterials(mxml_path: str) -> list:
                 continue
 
             # Extract color
-            colour_elem = item_elem.find('.//Property[@name="Colour"]')
+            colour_elem = parser.find_child_property(item_elem, 'Colour')
             colour = parser.parse_colour(colour_elem)
 
             # Extract numeric values
@@ -53,10 +53,9 @@ def _load_item_names():
     if products_path.exists():
         root = parser.load_xml(str(products_path))
         table_prop = root.find('.//Property[@name="Table"]')
-        if table_prop:
-            for item in table_prop.findall('./Property[@name="Table"]'):
-                item_id = parser.get_property_value(item, 'ID', '')
-                name_key = parser.get_property_value(item, 'Name', '')
+        if table_prop is not None:
+            for item in table_prop.iterfind('./Property[@name="Table"]'):
+                item_id, name_key = parser.get_property_values(item, ('ID', 'Name'))
                 if item_id:
                     _item_names_cache[item_id] = get_translated_name(item_id, name_key)
 
@@ -65,10 +64,9 @@ def _load_item_names():
     if substances_path.exists():
         root = parser.load_xml(str(substances_path))
         table_prop = root.find('.//Property[@name="Table"]')
-        if table_prop:
-            for item in table_prop.findall('./Property[@name="Table"]'):
-                item_id = parser.get_property_value(item, 'ID', '')
-                name_key = parser.get_property_value(item, 'Name', '')
+        if table_prop is not None:
+            for item in table_prop.iterfind('./Property[@name="Table"]'):
+                item_id, name_key = parser.get_property_values(item, ('ID', 'Name'))
                 if item_id and name_key:
                     _item_names_cache[item_id] = get_translated_name(item_id, name_key)
 
@@ -117,7 +115,7 @@ def parse_refinery(mxml_path: str, only_refinery: bool = True) -> list:
         return recipes
 
     # Each recipe is a Property element with value="GcRefinerRecipe"
-    for recipe_elem in table_prop.findall('./Property[@name="Table"]'):
+    for recipe_elem in table_prop.iterfind('./Property[@name="Table"]'):
         try:
             # Get recipe ID
             recipe_id = parser.get_property_value(recipe_elem, 'Id', f'RECIPE_{recipe_counter}')
@@ -150,9 +148,9 @@ def parse_refinery(mxml_path: str, only_refinery: bool = True) -> list:
 
             # Parse Ingredients (Inputs)
             inputs = []
-            ingredients_prop = recipe_elem.find('.//Property[@name="Ingredients"]')
+            ingredients_prop = parser.find_child_property(recipe_elem, 'Ingredients')
             if ingredients_prop is not None:
-                for ingredient in ingredients_prop.findall('./Property'):
+                for ingredient in ingredients_prop.iterfind('./Property'):
                     ing_id = parser.get_property_value(ingredient, 'Id', '')
                     ing_amount = parser.get_property_value(ingredient, 'Amount', '1')
                     if ing_id:
@@ -164,7 +162,7 @@ def parse_refinery(mxml_path: str, only_refinery: bool = True) -> list:
 
             # Parse Result (Output)
             output = {}
-            result_prop = recipe_elem.find('.//Property[@name="Result"]')
+            result_prop = parser.find_child_property(recipe_elem, 'Result')
             if result_prop is not None:
                 output_id = parser.get_property_value(result_prop, 'Id', '')
                 output_amount = parser.get_property_value(result_prop, 'Amount', '1')
@@ -41,7 +41,7 @@ def parse_ship_components(mxml_path: str) -> list:
         return components
 
     # Each product is a Property element with value="GcProductData"
-    for product_elem in table_prop.findall('./Property[@name="Table"]'):
+    for product_elem in table_prop.iterfind('./Property[@name="Table"]'):
         try:
             # Extract basic info
             item_id = parser.get_property_value(product_elem, 'ID', '')
@@ -66,13 +66,13 @@ def parse_ship_components(mxml_path: str) -> list:
 
             # Enriched product metadata
             hero_icon_raw = parser.get_property_value(
-                product_elem.find('.//Property[@name="HeroIcon"]'),
+                parser.find_child_property(product_elem, 'HeroIcon'),
                 'Filename',
                 '',
             )
             hero_icon_path = normalize_game_icon_path(hero_icon_raw) if hero_icon_raw else ''
 
-            colour_elem = product_elem.find('.//Property[@name="Colour"]')
+            colour_elem = parser.find_child_property(product_elem, 'Colour')
             colour = parser.parse_colour(colour_elem)
 
             rarity = parser.get_nested_enum(product_elem, 'Rarity', 'Rarity', '')
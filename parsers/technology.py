@@ -23,7 +23,7 @@ def parse_technology(mxml_path: str) -> list:
         print("Warning: Could not find Table property in MXML")
         return technologies
 
-    for tech_elem in table_prop.findall('./Property[@name="Table"]'):
+    for tech_elem in table_prop.iterfind('./Property[@name="Table"]'):
         try:
             tech_id = parser.get_property_value(tech_elem, 'ID', f'TECH_{tech_counter}')
             name_key = parser.get_property_value(tech_elem, 'Name', '')
@@ -37,14 +37,14 @@ def parse_technology(mxml_path: str) -> list:
             description = parser.translate(description_key, '')
 
             # Extract Icon path from game (matches data/EXTRACTED/textures/...)
-            icon_prop = tech_elem.find('.//Property[@name="Icon"]')
+            icon_prop = parser.find_child_property(tech_elem, 'Icon')
             icon_filename = parser.get_property_value(icon_prop, 'Filename', '') if icon_prop is not None else ''
             icon_path = normalize_game_icon_path(icon_filename) if icon_filename else ''
             if not icon_path:
                 continue
 
             # Extract color
-            colour_elem = tech_elem.find('.//Property[@name="Colour"]')
+            colour_elem = parser.find_child_property(tech_elem, 'Colour')
             colour = parser.parse_colour(colour_elem)
 
             # Extract values
@@ -52,9 +52,9 @@ def parse_technology(mxml_path: str) -> list:
 
             # Extract requirements
             required_items = []
-            requirements_prop = tech_elem.find('.//Property[@name="Requirements"]')
+            requirements_prop = parser.find_child_property(tech_elem, 'Requirements')
             if requirements_prop is not None:
-                for req_elem in requirements_prop.findall('./Property'):
+                for req_elem in requirements_prop.iterfind('./Property'):
                     req_id = parser.get_property_value(req_elem, 'ID', '')
                     req_amount = parser.get_property_value(req_elem, 'Amount', '1')
                     if req_id:
@@ -65,9 +65,9 @@ def parse_technology(mxml_path: str) -> list:
 
             # Extract stat bonuses
             stat_bonuses = []
-            stat_bonuses_prop = tech_elem.find('.//Property[@name="StatBonuses"]')
+            stat_bonuses_prop = parser.find_child_property(tech_elem, 'StatBonuses')
             if stat_bonuses_prop is not None:
-                for stat_elem in stat_bonuses_prop.findall('./Property'):
+                for stat_elem in stat_bonuses_prop.iterfind('./Property'):
                     stat_type_prop = stat_elem.find('.//Property[@name="Stat"]//Property[@name="StatsType"]')
                     stat_type = stat_type_prop.get('value', '') if stat_type_prop is not None else ''
                     bonus = parser.get_property_value(stat_elem, 'Bonus', '0')
@@ -93,9 +93,9 @@ def parse_technology(mxml_path: str) -> list:
             tech_category = parser.get_nested_enum(tech_elem, 'Category', 'TechnologyCategory', '')
             tech_rarity = parser.get_nested_enum(tech_elem, 'Rarity', 'TechnologyRarity', '')
             charge_by_list = []
-            charge_by_prop = tech_elem.find('.//Property[@name="ChargeBy"]')
+            charge_by_prop = parser.find_child_property(tech_elem, 'ChargeBy')
             if charge_by_prop is not None:
-                for cb in charge_by_prop.findall('./Property[@name="ChargeBy"]'):
+                for cb in charge_by_prop.iterfind('./Property[@name="ChargeBy"]'):
                     val = cb.get('value', '')
                     if val:
                         charge_by_list.append(val)
@@ -33,6 +33,52 @@ STARSHIP_UPGRADE_GROUPS = {
     'Starship Core Component',
 }
 
+# EXCEPTION: Allow ship components even if names aren't translated
+SHIP_COMPONENT_GROUPS = {
+    'Hauler Starship Component',
+    'Fighter Starship Component',
+    'Solar Starship Component',
+    'Explorer Starship Component',
+    'Living Ship Component',
+    'Starship Core Component',
+}
+
+# EXCEPTION: Allow these groups even if name looks untranslated (high volume in none.json)
+NAME_FILTER_EXEMPT_GROUPS = {
+    'Edible Product',
+    'Exclusive Companion Egg',
+    'Exclusive Multifunction Survival Device',
+    'Exclusive Spacecraft',
+    'Pyrotechnics Multi-Pack',
+    'Unlockable Armour',
+    'Unlockable Boots',
+    'Unlockable Cape',
+    'Unlockable Companion Accessory',
+    'Unlockable Gloves',
+    'Unlockable Head',
+    'Unlockable Helmet',
+    'Unlockable Hood',
+    'Unlockable Jetpack',
+    'Unlockable Leg Customisation',
+    'Unlockable Torso Customisation',
+}
+
+GENERIC_FOOD_NAME_TOKENS = ('Bug', 'Pcat', 'Horror', 'Bjam', 'Pcatbut', 'Pcatgek')
+
+# Developer/debug group keywords (lowercase; matched as substrings of the lowercased group).
+JUNK_GROUP_KEYWORDS = (
+    'biggs',        # Developer placeholders
+    'basic f',      # Basic ship class placeholders
+    'basic b',
+    'basic s',
+    'basic t',
+    'basic legacy',
+    'wall art',     # Internal decorations
+    'planet tech',  # Developer tech
+    'base tech',    # Internal base building
+    'rooms',        # Generic room placeholders
+)
+
 # Categorization rules: each file maps Group values to determine which items belong
 # ORDER MATTERS: Earlier rules take precedence over later ones
 CATEGORIZATION_RULES = {
@@ -896,35 +942,7 @@ def categorize_item(item: dict) -> str | None:
     if not group:
         return None
 
-    # EXCEPTION: Allow ship components even if names aren't translated
-    ship_component_groups = {
-        'Hauler Starship Component',
-        'Fighter Starship Component',
-        'Solar Starship Component',
-        'Explorer Starship Component',
-        'Living Ship Component',
-        'Starship Core Component',
-    }
-    # EXCEPTION: Allow these groups even if name looks untranslated (high volume in none.json)
-    name_filter_exempt_groups = {
-        'Edible Product',
-        'Exclusive Companion Egg',
-        'Exclusive Multifunction Survival Device',
-        'Exclusive Spacecraft',
-        'Pyrotechnics Multi-Pack',
-        'Unlockable Armour',
-        'Unlockable Boots',
-        'Unlockable Cape',
-        'Unlockable Companion Accessory',
-        'Unlockable Gloves',
-        'Unlockable Head',
-        'Unlockable Helmet',
-        'Unlockable Hood',
-        'Unlockable Jetpack',
-        'Unlockable Leg Customisation',
-        'Unlockable Torso Customisation',
-    }
-    if group in ship_component_groups or group in name_filter_exempt_groups:
+    if group in SHIP_COMPONENT_GROUPS or group in NAME_FILTER_EXEMPT_GROUPS:
         # Valid even with "Ui " or untranslated-style names
         pass
     else:
@@ -934,30 +952,17 @@ def categorize_item(item: dict) -> str | None:
             name.startswith('Ui ') or
             name == item_id or
             (name.startswith('Ui') and '_' not in name and len(name.split()) <= 4) or
-            (name.startswith('Food ') and any(x in name for x in ['Bug', 'Pcat', 'Horror', 'Bjam', 'Pcatbut', 'Pcatgek'])) or  # Skip generic food IDs
+            (name.startswith('Food ') and any(x in name for x in GENERIC_FOOD_NAME_TOKENS)) or  # Skip generic food IDs
             (group.startswith('Ui ') and group.endswith(' Sub'))):
             return None
 
     # Skip developer/debug items (these are not visible in-game)
-    junk_keywords = [
-        'Biggs',        # Developer placeholders
-        'Basic F',      # Basic ship class placeholders
-        'Basic B',
-        'Basic S',
-        'Basic T',
-        'Basic Legacy',
-        'Wall Art',     # Internal decorations
-        'Planet Tech',  # Developer tech
-        'Base Tech',    # Internal base building
-        'Rooms',        # Generic room placeholders
-    ]
-
-    for junk in junk_keywords:
-        if junk.lower() in group.lower():
+    group_lower = group.lower()
+    for junk in JUNK_GROUP_KEYWORDS:
+        if junk in group_lower:
             return None
 
     name_lower = name.lower()
-    group_lower = group.lower()
     item_id_lower = item_id.lower()
 
     # Route every upgrade-like item into a dedicated upgrades file.
@@ -14,9 +14,10 @@ Why curated mappings are needed:
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
 
+from utils.jsonio import dump_json, load_json
+
 
 # Curated defaults for the common FE prompt tokens.
 # These match known in-game defaults for major platforms.
@@ -49,8 +50,7 @@ ACTION_PATH_TO_FE_TOKEN = {
 
 
 def _load_actions_json(actions_json_path: Path) -> dict:
-    with open(actions_json_path, encoding="utf-8") as f:
-        return json.load(f)
+    return load_json(actions_json_path)
 
 
 def _extract_english_action_labels(actions_data: dict) -> dict[str, str]:
@@ -144,8 +144,7 @@ def main(argv=None) -> int:
     lookup = _build_lookup_payload(action_labels)
 
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(lookup, f, indent=2, ensure_ascii=False)
+    dump_json(lookup, args.output, indent=2)
 
     total_rows = sum(len(rows) for rows in lookup.values())
     print(
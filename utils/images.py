@@ -6,6 +6,8 @@ import shutil
 import subprocess
 from pathlib import Path
 
+from utils.jsonio import load_json
+
 
 ICON_JSON_FILES = [
     "Buildings.json",
@@ -42,8 +44,7 @@ def collect_id_icon_pairs(json_dir: Path) -> list[tuple[str, str]]:
         if not path.exists():
             continue
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(path)
         except (json.JSONDecodeError, OSError) as e:
             print(f"[WARN] Skip {filename}: {e}")
             continue
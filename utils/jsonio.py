@@ -0,0 +1,46 @@
+"""JSON read/write helpers: orjson when installed, stdlib json otherwise."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json produces the same structure.
+    orjson = None
+
+
+def loads_json(raw: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def load_json(path: str | Path) -> Any:
+    """Read and parse a UTF-8 JSON file."""
+    return loads_json(Path(path).read_bytes())
+
+
+def dumps_json(data: Any, *, sort_keys: bool = False) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes for in-memory comparison.
+    Formatting differs between orjson and stdlib json, so never write this to tracked files.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, sort_keys=sort_keys).encode('utf-8')
+
+
+def dump_json(data: Any, path: str | Path, *, indent: str | int | None = '\t') -> None:
+    """
+    Write data as UTF-8 JSON to path (non-ASCII kept as-is).
+    Always uses stdlib json so committed outputs are byte-identical whether or not orjson
+    is installed (orjson writes small floats without an exponent).
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(data, indent=indent, ensure_ascii=False))
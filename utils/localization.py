@@ -1,49 +1,12 @@
 """Parse localization MXML files into data/json/localization.json."""
-import json
-import re
-import xml.etree.ElementTree as ET
 from pathlib import Path
 
-_LOWERCASE_WORDS = frozenset({
-    'a', 'an', 'the', 'and', 'or', 'but', 'of', 'in', 'on', 'at', 'to', 'for',
-    'with', 'by', 'as', 'from', 'into', 'onto', 'upon', 'nor', 'so', 'yet',
-})
-
-
-def strip_markup_tags(text: str) -> str:
-    if not text:
-        return text
-    return re.sub(r'<[^>]*>', '', text)
-
-
-def _capitalize_word(word: str, force_capitalize: bool) -> str:
-    if len(word) >= 3 and word.startswith("'") and word.endswith("'"):
-        inner = word[1:-1]
-        return "'" + (inner.capitalize() if force_capitalize else inner.lower()) + "'"
-    return word.capitalize() if force_capitalize else word.lower()
-
-
-def title_case_name(s: str) -> str:
-    if not s or not s.strip():
-        return s
-    words = s.strip().split()
-    if not words:
-        return s
-    result = []
-    for i, word in enumerate(words):
-        lower = word.lower()
-        is_first = i == 0
-        is_last = i == len(words) - 1
-        if is_first or is_last or lower not in _LOWERCASE_WORDS:
-            result.append(_capitalize_word(word, force_capitalize=True))
-        else:
-            result.append(_capitalize_word(word, force_capitalize=False))
-    return ' '.join(result)
+from parsers.base_parser import parse_mxml, strip_markup_tags, title_case_name
+from utils.jsonio import dump_json
 
 
 def parse_localization(mxml_path: str) -> dict:
-    tree = ET.parse(mxml_path)
-    root = tree.getroot()
+    root = parse_mxml(mxml_path)
     translations = {}
 
     table_prop = root.find('.//Property[@name="Table"]')
@@ -51,7 +14,7 @@ def parse_localization(mxml_path: str) -> dict:
         print("Warning: Could not find Table property in localization MXML")
         return translations
 
-    for entry in table_prop.findall('./Property[@name="Table"]'):
+    for entry in table_prop.iterfind('./Property[@name="Table"]'):
         loc_id = entry.get('_id', '')
         if not loc_id:
             id_prop = entry.find('.//Property[@name="Id"]')
@@ -106,8 +69,7 @@ def build_localization_json(base_path: Path | None = None) -> int:
 
     output_path = base_path / 'data' / 'json' / 'localization.json'
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(all_translations, f, indent='\t', ensure_ascii=False)
+    dump_json(all_translations, output_path, indent='\t')
 
     print(f"[OK] Localization: {len(all_translations)} translations -> {output_path.name}\n")
     return len(all_translations)
@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from utils.jsonio import dump_json, dumps_json, load_json
+
 IGNORED_REPORT_FILES = {"localization.json"}
 
 
@@ -18,8 +21,6 @@ def _sanitize_version(value: str) -> str:
 
 
 def detect_version_key(repo_root: Path) -> str:
-    import os
-
     explicit = (os.environ.get("NMS_GAME_VERSION") or os.environ.get("NMS_VERSION") or "").strip()
     if explicit:
         return _sanitize_version(explicit)
@@ -44,8 +45,7 @@ def _load_json(path: Path) -> Any:
     if not path.exists():
         return None
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return load_json(path)
     except (OSError, json.JSONDecodeError):
         return None
 
@@ -82,8 +82,8 @@ def _compare_file(old_data: Any, new_data: Any) -> dict[str, Any]:
         changed_ids = sorted(
             iid
             for iid in (old_ids & new_ids)
-            if json.dumps(old_by_id[iid], sort_keys=True, ensure_ascii=False)
-            != json.dumps(new_by_id[iid], sort_keys=True, ensure_ascii=False)
+            if dumps_json(old_by_id[iid], sort_keys=True)
+            != dumps_json(new_by_id[iid], sort_keys=True)
         )
         return {
             "old_count": len(old_by_id),
@@ -233,8 +233,7 @@ def generate_refresh_report(repo_root: Path) -> dict[str, Any]:
 
     with open(md_path, "w", encoding="utf-8") as f:
         f.write(markdown)
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(report_payload, f, indent=2, ensure_ascii=False)
+    dump_json(report_payload, json_path, indent=2)
 
     reports_root.mkdir(parents=True, exist_ok=True)
     with open(reports_root / "latest_report.md", "w", encoding="utf-8") as f:
@@ -248,8 +247,7 @@ def generate_refresh_report(repo_root: Path) -> dict[str, Any]:
         "report_markdown": str(md_path.relative_to(repo_root)),
         "report_json": str(json_path.relative_to(repo_root)),
     }
-    with open(latest_run_meta_path, "w", encoding="utf-8") as f:
-        json.dump(latest_meta, f, indent=2, ensure_ascii=False)
+    dump_json(latest_meta, latest_run_meta_path, indent=2)
 
     totals = {
         "added": sum(len(info["added_ids"]) for info in per_file.values()),
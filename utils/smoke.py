@@ -6,6 +6,8 @@ import argparse
 import json
 from pathlib import Path
 
+from utils.jsonio import load_json
+
 EXPECTED_JSON_FILES = [
     "Buildings.json",
     "ConstructedTechnology.json",
@@ -28,8 +30,7 @@ EXPECTED_JSON_FILES = [
 
 
 def _load_json(path: Path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_json(path)
 
 
 def run_smoke_check(